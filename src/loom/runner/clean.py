@@ -1,6 +1,9 @@
 """Clean pipeline data functionality."""
 
+import os
 import shutil
+import stat
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
 from typing import TYPE_CHECKING, Literal
@@ -15,6 +18,9 @@ if TYPE_CHECKING:
 # Thumbnail cache directory name
 THUMBNAIL_DIR_NAME = ".loom-thumbnails"
 
+# Upper bound on paths trashed/deleted concurrently
+_MAX_CLEAN_WORKERS = 8
+
 
 @dataclass
 class CleanResult:
@@ -44,7 +50,7 @@ def get_cleanable_paths(
     Returns:
         List of tuples (name, path, exists) for each cleanable path.
     """
-    paths: list[tuple[str, Path, bool]] = []
+    candidates: list[tuple[str, Path]] = []
 
     # Collect all data node paths (skip URLs as they're stored in cache)
     for name in config.variables:
@@ -57,23 +63,31 @@ def get_cleanable_paths(
             continue
 
         try:
-            path = config.resolve_path(f"${name}")
-            paths.append((name, path, path.exists()))
+            candidates.append((name, config.resolve_path(f"${name}")))
         except (ValueError, OSError):
             # Skip paths that can't be resolved
             pass
 
     # Add thumbnail cache directory if requested
     if include_thumbnails:
-        thumbnail_dir = config.base_dir / THUMBNAIL_DIR_NAME
-        paths.append((THUMBNAIL_DIR_NAME, thumbnail_dir, thumbnail_dir.exists()))
+        candidates.append((THUMBNAIL_DIR_NAME, config.base_dir / THUMBNAIL_DIR_NAME))
 
     # Add URL cache directory if requested
     if include_url_cache:
-        url_cache_dir = config.base_dir / URL_CACHE_DIR_NAME
-        paths.append((URL_CACHE_DIR_NAME, url_cache_dir, url_cache_dir.exists()))
+        candidates.append((URL_CACHE_DIR_NAME, config.get_url_cache_dir()))
+
+    # Existence checks are independent stats, so on networked filesystems they
+    # are issued concurrently instead of paying one round-trip per path
+    resolved = [path for _, path in candidates]
+    if len(resolved) > 1:
+        with ThreadPoolExecutor(max_workers=min(_MAX_CLEAN_WORKERS, len(resolved))) as pool:
+            exists_flags = list(pool.map(_lexists, resolved))
+    else:
+        exists_flags = [_lexists(path) for path in resolved]
 
-    return paths
+    return [
+        (name, path, exists) for (name, path), exists in zip(candidates, exists_flags, strict=True)
+    ]
 
 
 def clean_pipeline_data(
@@ -82,6 +96,7 @@ def clean_pipeline_data(
     include_thumbnails: bool = True,
     include_source: bool = False,
     include_url_cache: bool = True,
+    paths: list[tuple[str, Path, bool]] | None = None,
 ) -> list[CleanResult]:
     """Clean all data node files from the pipeline.
 
@@ -92,43 +107,108 @@ def clean_pipeline_data(
         include_source: Whether to include source data (not produced by any step).
             Default is False to protect original input data from accidental deletion.
         include_url_cache: Whether to include .loom-url-cache directory.
+        paths: Result of an earlier get_cleanable_paths() call to clean, e.g. the
+            list already shown to the user. When given, the include_* flags are
+            ignored and paths are not resolved again.
 
     Returns:
         List of CleanResult objects describing what happened to each path.
     """
-    results: list[CleanResult] = []
-    paths = get_cleanable_paths(
-        config,
-        include_thumbnails=include_thumbnails,
-        include_source=include_source,
-        include_url_cache=include_url_cache,
-    )
-
-    for name, path, exists in paths:
-        if not exists:
-            results.append(CleanResult(path=path, success=True, action="skipped"))
-            continue
+    if paths is None:
+        paths = get_cleanable_paths(
+            config,
+            include_thumbnails=include_thumbnails,
+            include_source=include_source,
+            include_url_cache=include_url_cache,
+        )
+
+    existing = [path for _, path, exists in paths if exists]
+    cleaned: list[CleanResult] = []
+    if existing and permanent:
+        # Paths are independent, so their (syscall-bound) removal runs concurrently
+        with ThreadPoolExecutor(max_workers=min(_MAX_CLEAN_WORKERS, len(existing))) as pool:
+            cleaned = list(pool.map(lambda p: _clean_one(p, permanent), existing))
+    elif existing:
+        cleaned = _trash_paths(existing)
+
+    # Report in the same order as the input paths
+    cleaned_iter = iter(cleaned)
+    return [
+        next(cleaned_iter) if exists else CleanResult(path=path, success=True, action="skipped")
+        for _, path, exists in paths
+    ]
+
+
+def _clean_one(path: Path, permanent: bool) -> CleanResult:
+    """Trash or delete a single existing path.
+
+    Args:
+        path: Path to clean.
+        permanent: If True, permanently delete. If False, move to trash.
+
+    Returns:
+        CleanResult describing the outcome.
+    """
+    try:
+        if permanent:
+            _delete_path(path)
+            return CleanResult(path=path, success=True, action="deleted")
+        send2trash(str(path))
+        return CleanResult(path=path, success=True, action="trashed")
+    except Exception as e:
+        return CleanResult(path=path, success=False, error=str(e))
 
-        try:
-            if permanent:
-                _delete_path(path)
-                results.append(CleanResult(path=path, success=True, action="deleted"))
-            else:
-                send2trash(str(path))
-                results.append(CleanResult(path=path, success=True, action="trashed"))
-        except Exception as e:
-            results.append(CleanResult(path=path, success=False, error=str(e)))
 
-    return results
+def _trash_paths(paths: list[Path]) -> list[CleanResult]:
+    """Move existing paths to the trash in a single send2trash call.
+
+    If the batch fails part-way, paths that are already gone are reported as
+    trashed and the rest are retried one by one, so each error is attributed
+    to the path that caused it.
+
+    Args:
+        paths: Paths to trash.
+
+    Returns:
+        CleanResult for each path, in the same order.
+    """
+    try:
+        send2trash([str(path) for path in paths])
+    except Exception:
+        return [
+            _clean_one(path, permanent=False)
+            if _lexists(path)
+            else CleanResult(path=path, success=True, action="trashed")
+            for path in paths
+        ]
+    return [CleanResult(path=path, success=True, action="trashed") for path in paths]
+
+
+def _lexists(path: Path) -> bool:
+    """Check whether a path exists without following a final symlink.
+
+    Args:
+        path: Path to check.
+
+    Returns:
+        True if anything (including a dangling symlink) is at the path.
+    """
+    try:
+        os.lstat(path)
+    except (FileNotFoundError, NotADirectoryError):
+        return False
+    return True
 
 
 def _delete_path(path: Path) -> None:
     """Permanently delete a path (file or directory).
 
+    Symlinks are removed themselves, never the directory they point to.
+
     Args:
         path: Path to delete.
     """
-    if path.is_dir():
+    if stat.S_ISDIR(os.lstat(path).st_mode):
         shutil.rmtree(path)
     else:
         path.unlink()
@@ -2,6 +2,7 @@
 """Pipeline runner CLI."""
 
 import argparse
+import shlex
 import sys
 from pathlib import Path
 
@@ -21,6 +22,7 @@ Examples:
   %(prog)s pipeline.yml --step extract     # Run specific step
   %(prog)s pipeline.yml --from classify    # Run from step onward
   %(prog)s pipeline.yml --dry-run          # Preview commands
+  %(prog)s pipeline.yml --incremental      # Skip steps with up-to-date outputs
   %(prog)s pipeline.yml --set backend=local
   %(prog)s pipeline.yml --parallel         # Run with parallel execution
   %(prog)s pipeline.yml --parallel --max-workers 2
@@ -71,6 +73,16 @@ Examples:
 
     # Execution mode
     parser.add_argument("--dry-run", action="store_true", help="Print commands without executing")
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help="Skip steps whose outputs are newer than all of their inputs",
+    )
+    parser.add_argument(
+        "--fail-fast",
+        action="store_true",
+        help="Start no further steps once any step fails (running steps finish)",
+    )
 
     # Parallel execution
     parallel_group = parser.add_mutually_exclusive_group()
@@ -172,13 +184,19 @@ Examples:
             return 1
         steps_to_run = [s.name for s in group_steps]
 
-    # Build extra args dict
-    extra_args = {}
+    # Build extra args dict, tokenized once with shell quoting rules
+    extra_args: dict[str, list[str]] = {}
     if args.extra and steps_to_run and len(steps_to_run) == 1:
-        extra_args[steps_to_run[0]] = args.extra
+        try:
+            extra_args[steps_to_run[0]] = shlex.split(args.extra)
+        except ValueError as e:
+            print(f"Error: Invalid --extra arguments: {e}", file=sys.stderr)
+            return 1
 
     # Run pipeline
-    executor = PipelineExecutor(config, dry_run=args.dry_run)
+    executor = PipelineExecutor(
+        config, dry_run=args.dry_run, incremental=args.incremental, fail_fast=args.fail_fast
+    )
     results = executor.run_pipeline(
         steps=steps_to_run,
         from_step=args.from_step,
@@ -435,8 +453,8 @@ def _handle_clean(config: PipelineConfig, permanent: bool, skip_confirm: bool) -
             print("Cancelled.")
             return 0
 
-    # Perform the clean
-    results = clean_pipeline_data(config, permanent=permanent)
+    # Perform the clean on the paths shown above
+    results = clean_pipeline_data(config, permanent=permanent, paths=paths)
 
     # Report results
     cleaned = sum(1 for r in results if r.action in ("trashed", "deleted"))
@@ -1,15 +1,47 @@
 """Configuration parsing for pipelines."""
 
-from dataclasses import dataclass, field
+import copy
+import functools
+import sys
+from collections.abc import Iterator
+from dataclasses import dataclass, field, replace
 from pathlib import Path
-from typing import Any
+from typing import Any, NamedTuple
 
 import yaml
 
 from .url import URL_CACHE_DIR_NAME, ensure_url_downloaded, is_url
 
+# libyaml-backed loader (falls back to pure Python if PyYAML was built without it)
+_SafeLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
 
-@dataclass
+
+def _intern_refs(mapping: dict[str, Any]) -> dict[str, Any]:
+    """Intern the string keys and values of a parsed inputs/outputs mapping.
+
+    The same data references recur across many steps; interning makes every
+    occurrence share one string object instead of one per YAML scalar.
+    """
+    return {
+        sys.intern(k) if type(k) is str else k: sys.intern(v) if type(v) is str else v
+        for k, v in mapping.items()
+    }
+
+
+@functools.lru_cache(maxsize=1024)
+def _absolute_path(path_str: str, base_dir: Path) -> Path:
+    """Make a path string absolute relative to base_dir, memoized.
+
+    Only the (pure) string-to-Path step is cached; $reference resolution stays
+    live so edits to variables/parameters are always honoured.
+    """
+    path = Path(path_str)
+    if not path.is_absolute():
+        path = base_dir / path
+    return path
+
+
+@dataclass(frozen=True, slots=True)
 class LoopConfig:
     """Configuration for a loop block on a pipeline step."""
 
@@ -26,31 +58,14 @@ class LoopConfig:
         if "into" not in data:
             raise KeyError("Loop config must have 'into' field")
         return cls(
-            over=data["over"],
-            into=data["into"],
+            over=sys.intern(data["over"]),
+            into=sys.intern(data["into"]),
             parallel=data.get("parallel"),
             filter=data.get("filter"),
         )
 
 
-def _flatten_pipeline(pipeline: list[dict[str, Any]]) -> list[dict[str, Any]]:
-    """Flatten grouped pipeline entries into a flat list with group tag injected.
-
-    Group blocks of the form ``{"group": name, "steps": [...]}`` are expanded
-    into flat step dicts with a ``"group"`` key added to each step.
-    Ungrouped steps are passed through unchanged.
-    """
-    flat = []
-    for entry in pipeline:
-        if "group" in entry and "steps" in entry:
-            for step in entry["steps"]:
-                flat.append({**step, "group": entry["group"]})
-        else:
-            flat.append(entry)
-    return flat
-
-
-@dataclass
+@dataclass(frozen=True, slots=True)
 class StepConfig:
     """Configuration for a single pipeline step."""
 
@@ -77,8 +92,8 @@ class StepConfig:
         return cls(
             name=data["name"],
             script=script,
-            inputs=data.get("inputs", {}),
-            outputs=data.get("outputs", {}),
+            inputs=_intern_refs(data.get("inputs") or {}),
+            outputs=_intern_refs(data.get("outputs") or {}),
             args=data.get("args", {}),
             optional=data.get("optional", False),
             disabled=data.get("disabled", False),
@@ -87,6 +102,88 @@ class StepConfig:
         )
 
 
+def _iter_steps(pipeline: list[dict[str, Any]]) -> Iterator[StepConfig]:
+    """Build steps from pipeline entries, expanding group blocks in the same pass.
+
+    Group blocks of the form ``{"group": name, "steps": [...]}`` yield one step
+    per nested entry with its ``group`` set. Ungrouped steps are built as-is.
+
+    The group tag is set on the step dicts in place; callers pass a freshly
+    parsed tree they own.
+    """
+    for entry in pipeline:
+        if "group" in entry and "steps" in entry:
+            group = entry["group"]
+            for step in entry["steps"]:
+                step["group"] = group
+                yield StepConfig.from_dict(step)
+        else:
+            yield StepConfig.from_dict(entry)
+
+
+class _ParsedPipeline(NamedTuple):
+    """Location-independent contents of a pipeline file, shared via the parse cache."""
+
+    steps: tuple[StepConfig, ...]
+    variables: dict[str, str]
+    data_types: dict[str, str]
+    parameters: dict[str, Any]
+    parallel: bool
+    max_workers: int | None
+
+
+@functools.lru_cache(maxsize=16)
+def _parse_pipeline(content: bytes) -> _ParsedPipeline:
+    """Parse pipeline YAML bytes into step and data definitions, memoized.
+
+    Keying on content rather than mtime means an edit can never be served
+    stale, while the server's per-request reloads of an unchanged pipeline
+    skip both the YAML parse and building the steps. Callers must copy
+    anything they intend to mutate.
+    """
+    # Bytes let the parser detect and decode the encoding itself
+    data = yaml.load(content, Loader=_SafeLoader) or {}
+
+    # Reject pipelines with legacy 'variables' section
+    if data.get("variables"):
+        raise ValueError(
+            "The 'variables' section is deprecated. "
+            "Use typed 'data' section instead. "
+            "See examples for the new format."
+        )
+
+    steps = tuple(_iter_steps(data.get("pipeline", [])))
+
+    # Load variables from 'data' section
+    # Data nodes provide typed file/dir references
+    variables: dict[str, str] = {}
+    data_types: dict[str, str] = {}
+
+    # Extract path and type from each data entry
+    for name, entry in data.get("data", {}).items():
+        name = sys.intern(name)
+        if isinstance(entry, dict):
+            # New format: {type: ..., path: ..., ...}
+            variables[name] = entry.get("path", "")
+            data_types[name] = entry.get("type", "")
+        else:
+            # Fallback: treat as path string
+            variables[name] = str(entry)
+            data_types[name] = ""
+
+    # Parse execution settings
+    execution = data.get("execution", {})
+
+    return _ParsedPipeline(
+        steps=steps,
+        variables=variables,
+        data_types=data_types,
+        parameters=data.get("parameters", {}),
+        parallel=execution.get("parallel", False),
+        max_workers=execution.get("max_workers"),
+    )
+
+
 @dataclass
 class PipelineConfig:
     """Configuration for a full pipeline."""
@@ -99,18 +196,44 @@ class PipelineConfig:
     parallel: bool = False
     max_workers: int | None = None
     _output_producers: dict[str, str] = field(default_factory=dict, repr=False)
+    _step_dependencies: dict[str, frozenset[str]] = field(default_factory=dict, repr=False)
+    _step_dependents: dict[str, frozenset[str]] = field(default_factory=dict, repr=False)
+    _steps_by_name: dict[str, StepConfig] = field(default_factory=dict, repr=False)
+    _step_positions: dict[str, int] = field(default_factory=dict, repr=False)
+    _steps_by_group: dict[str, list[StepConfig]] = field(default_factory=dict, repr=False)
 
     def __post_init__(self) -> None:
-        """Build output producer mapping after init."""
+        """Build step/group indexes, output producer mapping and dependency edges."""
         self._output_producers = {}
-        for step in self.steps:
+        self._steps_by_name = {}
+        self._step_positions = {}
+        self._steps_by_group = {}
+        producers = self._output_producers
+        for index, step in enumerate(self.steps):
+            # First definition wins, matching a front-to-back scan
+            self._steps_by_name.setdefault(step.name, step)
+            self._step_positions.setdefault(step.name, index)
+            # Dict insertion order doubles as group order of first appearance
+            if step.group:
+                self._steps_by_group.setdefault(step.group, []).append(step)
             for var_ref in step.outputs.values():
-                var_name = var_ref.lstrip("$")
-                self._output_producers[var_name] = step.name
+                producers[var_ref.removeprefix("$")] = step.name
             # Register loop.into as produced by this step
             if step.loop is not None:
-                var_name = step.loop.into.lstrip("$")
-                self._output_producers[var_name] = step.name
+                producers[step.loop.into.removeprefix("$")] = step.name
+
+        # Dependencies are queried repeatedly by schedulers and validation
+        self._step_dependencies = {
+            step.name: self._find_step_dependencies(step) for step in self.steps
+        }
+        # Reverse edges, so schedulers can walk from a finished step to its consumers
+        dependents: dict[str, set[str]] = {name: set() for name in self._step_dependencies}
+        for name, deps in self._step_dependencies.items():
+            for dep in deps:
+                # A step reading its own output does not wait on itself
+                if dep != name:
+                    dependents[dep].add(name)
+        self._step_dependents = {name: frozenset(names) for name, names in dependents.items()}
 
     @classmethod
     def from_yaml(cls, path: Path) -> "PipelineConfig":
@@ -119,51 +242,30 @@ class PipelineConfig:
         All relative paths in the pipeline (scripts, data nodes) are resolved
         relative to the directory containing the YAML file.
         """
-        with open(path) as f:
-            data = yaml.safe_load(f) or {}
-
-        # Reject pipelines with legacy 'variables' section
-        if data.get("variables"):
-            raise ValueError(
-                "The 'variables' section is deprecated. "
-                "Use typed 'data' section instead. "
-                "See examples for the new format."
+        parsed = _parse_pipeline(path.read_bytes())
+
+        # Parsed objects are shared through the cache; give this config its own
+        # copies of the containers callers mutate (overrides, per-step args).
+        # Args and parameters may nest lists/dicts, so those are copied deeply.
+        steps = [
+            replace(
+                step,
+                inputs=dict(step.inputs),
+                outputs=dict(step.outputs),
+                args=copy.deepcopy(step.args),
             )
-
-        steps = [StepConfig.from_dict(s) for s in _flatten_pipeline(data.get("pipeline", []))]
-
-        # Load variables from 'data' section
-        # Data nodes provide typed file/dir references
-        variables: dict[str, str] = {}
-        data_types: dict[str, str] = {}
-
-        # Extract path and type from each data entry
-        for name, entry in data.get("data", {}).items():
-            if isinstance(entry, dict):
-                # New format: {type: ..., path: ..., ...}
-                variables[name] = entry.get("path", "")
-                data_types[name] = entry.get("type", "")
-            else:
-                # Fallback: treat as path string
-                variables[name] = str(entry)
-                data_types[name] = ""
-
-        # Store the pipeline file's directory for relative path resolution
-        base_dir = path.parent.resolve()
-
-        # Parse execution settings
-        execution = data.get("execution", {})
-        parallel = execution.get("parallel", False)
-        max_workers = execution.get("max_workers")
+            for step in parsed.steps
+        ]
 
         return cls(
-            variables=variables,
-            parameters=data.get("parameters", {}),
+            variables=dict(parsed.variables),
+            parameters=copy.deepcopy(parsed.parameters),
             steps=steps,
-            base_dir=base_dir,
-            data_types=data_types,
-            parallel=parallel,
-            max_workers=max_workers,
+            # Relative paths resolve against the pipeline file's directory
+            base_dir=path.parent.resolve(),
+            data_types=dict(parsed.data_types),
+            parallel=parsed.parallel,
+            max_workers=parsed.max_workers,
         )
 
     def resolve_value_with_loop(self, value: Any, loop_bindings: dict[str, str]) -> Any:
@@ -177,7 +279,7 @@ class PipelineConfig:
         Returns:
             Resolved value.
         """
-        if not isinstance(value, str) or not value.startswith("$"):
+        if type(value) is not str or value[:1] != "$":
             return value
         ref_name = value[1:]
         if ref_name in loop_bindings:
@@ -194,7 +296,9 @@ class PipelineConfig:
         Returns:
             Resolved value.
         """
-        if not isinstance(value, str) or not value.startswith("$"):
+        # Literals (non-strings, plain paths) are the common case, so bail out on
+        # an exact type check and a one-character slice before any lookup
+        if type(value) is not str or value[:1] != "$":
             return value
 
         ref_name = value[1:]  # Strip leading $
@@ -220,13 +324,9 @@ class PipelineConfig:
             Absolute Path object.
         """
         resolved = self.resolve_value(value)
-        path = Path(str(resolved))
 
         # Make relative paths absolute relative to pipeline directory
-        if not path.is_absolute():
-            path = self.base_dir / path
-
-        return path
+        return _absolute_path(str(resolved), self.base_dir)
 
     def resolve_script_path(self, script: str) -> Path:
         """Resolve a task script path to an absolute path.
@@ -237,17 +337,31 @@ class PipelineConfig:
         Returns:
             Absolute Path object.
         """
-        path = Path(script)
-        if not path.is_absolute():
-            path = self.base_dir / path
-        return path
+        return _absolute_path(script, self.base_dir)
 
     def get_step_by_name(self, name: str) -> StepConfig:
         """Get a step by its name."""
-        for step in self.steps:
-            if step.name == name:
-                return step
-        raise ValueError(f"Unknown step: {name}")
+        try:
+            return self._steps_by_name[name]
+        except KeyError:
+            raise ValueError(f"Unknown step: {name}") from None
+
+    def get_step_index(self, name: str) -> int:
+        """Get the position of a step in the pipeline definition.
+
+        Args:
+            name: Step name.
+
+        Returns:
+            Index into steps of the first step with this name.
+
+        Raises:
+            ValueError: If no step has this name.
+        """
+        try:
+            return self._step_positions[name]
+        except KeyError:
+            raise ValueError(f"Unknown step: {name}") from None
 
     def get_steps_by_group(self, group_name: str) -> list[StepConfig]:
         """Get all steps belonging to a named group, in pipeline order.
@@ -261,10 +375,10 @@ class PipelineConfig:
         Raises:
             ValueError: If no steps found for the given group name.
         """
-        steps = [s for s in self.steps if s.group == group_name]
+        steps = self._steps_by_group.get(group_name)
         if not steps:
             raise ValueError(f"Unknown group: {group_name}")
-        return steps
+        return list(steps)
 
     def get_group_names(self) -> list[str]:
         """Get unique group names in pipeline order of first appearance.
@@ -273,38 +387,46 @@ class PipelineConfig:
             List of group names, preserving order of first appearance.
             Empty list if no steps have groups.
         """
-        seen: set[str] = set()
-        names: list[str] = []
-        for step in self.steps:
-            if step.group and step.group not in seen:
-                seen.add(step.group)
-                names.append(step.group)
-        return names
-
-    def get_step_dependencies(self, step: StepConfig) -> set[str]:
+        return list(self._steps_by_group)
+
+    def get_step_dependencies(self, step: StepConfig) -> frozenset[str]:
         """Return names of steps that produce this step's inputs.
 
         Args:
             step: The step to find dependencies for.
 
         Returns:
-            Set of step names that must complete before this step.
+            Step names that must complete before this step. For steps of this
+            pipeline the frozenset is built once in __post_init__ and the same
+            object is returned on every call, so callers need not copy it.
         """
-        dependencies = set()
+        cached = self._step_dependencies.get(step.name)
+        if cached is not None:
+            return cached
+        return self._find_step_dependencies(step)
 
-        # Check each input to see if it's produced by another step
-        for var_ref in step.inputs.values():
-            var_name = var_ref.lstrip("$")
-            if var_name in self._output_producers:
-                dependencies.add(self._output_producers[var_name])
+    def get_step_dependents(self, name: str) -> frozenset[str]:
+        """Return names of steps that consume outputs of the given step.
 
+        Args:
+            name: Step name.
+
+        Returns:
+            Step names that depend on this step, excluding the step itself. Built
+            once in __post_init__; unknown names have no dependents.
+        """
+        return self._step_dependents.get(name, frozenset())
+
+    def _find_step_dependencies(self, step: StepConfig) -> frozenset[str]:
+        """Compute the producer steps of a step's inputs (and loop.over)."""
+        producers = self._output_producers
+        refs = list(step.inputs.values())
         # If this is a loop step, also depend on the step that produces loop.over
         if step.loop is not None:
-            var_name = step.loop.over.lstrip("$")
-            if var_name in self._output_producers:
-                dependencies.add(self._output_producers[var_name])
-
-        return dependencies
+            refs.append(step.loop.over)
+        return frozenset(
+            producers[var_name] for ref in refs if (var_name := ref.removeprefix("$")) in producers
+        )
 
     def is_source_data(self, name: str) -> bool:
         """Check if a data node is source (not produced by any step).
@@ -334,7 +456,8 @@ class PipelineConfig:
         Returns:
             Path to the URL cache directory.
         """
-        return self.base_dir / URL_CACHE_DIR_NAME
+        # Memoized per base_dir, so a reassigned base_dir is still honoured
+        return _absolute_path(URL_CACHE_DIR_NAME, self.base_dir)
 
     def is_url_path(self, value: Any) -> bool:
         """Check if a value resolves to a URL.
@@ -346,7 +469,7 @@ class PipelineConfig:
             True if the resolved value is an HTTP/HTTPS URL.
         """
         resolved = self.resolve_value(value)
-        return isinstance(resolved, str) and is_url(resolved)
+        return type(resolved) is str and is_url(resolved)
 
     def get_raw_path(self, value: Any) -> str:
         """Get the raw path value without downloading URLs.
@@ -388,8 +511,4 @@ class PipelineConfig:
             return ensure_url_downloaded(path_str, cache_dir)
 
         # Otherwise, resolve as normal path
-        path = Path(path_str)
-        if not path.is_absolute():
-            path = self.base_dir / path
-
-        return path
+        return _absolute_path(path_str, self.base_dir)
@@ -1,24 +1,95 @@
 """Pipeline execution engine."""
 
+import fnmatch
+import os
+import shlex
 import subprocess
 import sys
 import threading
-from concurrent.futures import Future, ThreadPoolExecutor
+from collections.abc import Callable, Mapping, Sequence
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 from pathlib import Path
 from typing import Any
 
 from .config import PipelineConfig, StepConfig
 from .orchestrator import EventType, PipelineOrchestrator, StepResult
+from .url import get_cache_path
 
 # Lock for thread-safe printing in parallel execution
 _print_lock = threading.Lock()
 
+# ASCII characters a value accepted by int()/float() can start with (they strip
+# whitespace first); non-ASCII heads are left to the converters (Unicode digits)
+_NUMBER_STARTS = frozenset("+-.0123456789") | {c for c in map(chr, range(128)) if c.isspace()}
 
-def _wait_brief() -> None:
-    """Brief sleep to avoid busy-waiting in parallel execution."""
-    import time
 
-    time.sleep(0.01)
+def _make_dir(directory: Path) -> None:
+    """Create a directory and its parents unless it already exists.
+
+    On re-runs output directories usually exist; one stat is cheaper than a
+    mkdir that fails with EEXIST and is then followed by the same stat.
+    """
+    if not directory.is_dir():
+        directory.mkdir(parents=True, exist_ok=True)
+
+
+def _list_loop_files(over_path: Path, pattern: str | None) -> list[Path]:
+    """List the items of a loop.over directory in name order.
+
+    Without a pattern, every file (following symlinks) is an item; with one,
+    every entry matching it, as Path.glob would return. Single-segment patterns
+    are matched against os.scandir names, so only matching entries become Path
+    objects and unfiltered listings avoid a stat per entry where the directory
+    entry already carries its type. Patterns spanning directories fall back to
+    Path.glob.
+
+    Args:
+        over_path: Resolved loop.over directory.
+        pattern: Optional loop.filter glob.
+
+    Returns:
+        Sorted item paths.
+    """
+    if pattern and ("/" in pattern or os.sep in pattern or "**" in pattern):
+        return sorted(over_path.glob(pattern))
+    with os.scandir(over_path) as entries:
+        if pattern:
+            names = [e.name for e in entries if fnmatch.fnmatch(e.name, pattern)]
+        else:
+            names = [e.name for e in entries if e.is_file()]
+    names.sort(key=os.path.normcase)  # Path ordering (case-insensitive on Windows)
+    return [over_path / name for name in names]
+
+
+def _skip_message(step_name: str | None, failed_deps: list[str] | None) -> str:
+    """Format the log line for a skipped step.
+
+    Args:
+        step_name: Name of the skipped step.
+        failed_deps: Failed or skipped dependencies; empty when the step was
+            skipped only because a fail-fast run stopped.
+
+    Returns:
+        Line to print.
+    """
+    if failed_deps:
+        return f"[SKIPPED] {step_name} (dependencies failed: {failed_deps})"
+    return f"[SKIPPED] {step_name} (pipeline stopped after a failure)"
+
+
+def _loop_binding(var_ref: Any, loop_bindings: dict[str, str]) -> str | None:
+    """Return the per-iteration value bound to a $reference, if any.
+
+    Args:
+        var_ref: Input or output value from the step definition.
+        loop_bindings: Per-iteration bindings, e.g. {"loop_item": "/path/file.jpg"}.
+
+    Returns:
+        The bound value, or None if var_ref is not a reference to a loop binding.
+    """
+    if type(var_ref) is not str or var_ref[:1] != "$":
+        return None
+    return loop_bindings.get(var_ref[1:])
 
 
 class PipelineExecutor:
@@ -28,28 +99,55 @@ class PipelineExecutor:
     in what order) while handling the actual subprocess execution.
     """
 
-    def __init__(self, config: PipelineConfig, dry_run: bool = False) -> None:
+    def __init__(
+        self,
+        config: PipelineConfig,
+        dry_run: bool = False,
+        incremental: bool = False,
+        fail_fast: bool = False,
+    ) -> None:
         """Initialize executor with pipeline configuration.
 
         Args:
             config: Pipeline configuration.
             dry_run: If True, print commands without executing.
+            incremental: If True, skip steps whose outputs are newer than their inputs.
+            fail_fast: If True, start no further steps once any step fails.
         """
         self.config = config
         self.dry_run = dry_run
+        self.incremental = incremental
+        self.fail_fast = fail_fast
         self._results: dict[str, bool] = {}
+        # Answers planning queries; each run gets its own orchestrator, which
+        # records that run's results
+        self._planner = PipelineOrchestrator(config)
+        # Output directories created by the current run's pre-pass
+        self._ready_dirs: set[Path] = set()
+        # Caps captured subprocesses across pipeline- and loop-level pools, so a
+        # parallel loop inside a parallel pipeline stays within max_workers
+        self._subprocess_slots = threading.BoundedSemaphore(config.max_workers or 4)
+        # Captured children still running, so an interrupted run can stop them
+        self._live_procs: set[subprocess.Popen[str]] = set()
+        self._live_procs_lock = threading.Lock()
+        # Set by _interrupt(); no captured child is started while it is set
+        self._stopping = threading.Event()
+        # Worker pool for parallel loop items, kept across loop steps until close()
+        self._item_pool: ThreadPoolExecutor | None = None
+        self._item_pool_lock = threading.Lock()
 
     def build_command(
         self,
         step: StepConfig,
-        extra_args: str | None = None,
+        extra_args: str | Sequence[str] | None = None,
         loop_bindings: dict[str, str] | None = None,
     ) -> list[str]:
         """Build subprocess command from step definition.
 
         Args:
             step: Step configuration.
-            extra_args: Additional arguments to append.
+            extra_args: Additional arguments to append, either already tokenized or
+                as a string split with shell quoting rules.
             loop_bindings: Per-iteration variable bindings for loop steps,
                 e.g. {"loop_item": "/path/file.jpg", "loop_output": "/out/file.jpg"}.
 
@@ -62,13 +160,8 @@ class PipelineExecutor:
 
         # Add positional inputs in order (resolved to absolute paths)
         for var_ref in step.inputs.values():
-            if (
-                loop_bindings
-                and isinstance(var_ref, str)
-                and var_ref.startswith("$")
-                and var_ref[1:] in loop_bindings
-            ):
-                cmd.append(loop_bindings[var_ref[1:]])
+            if loop_bindings and (bound := _loop_binding(var_ref, loop_bindings)) is not None:
+                cmd.append(bound)
             else:
                 # Use resolve_path_for_execution to handle URL downloads
                 resolved = self.config.resolve_path_for_execution(var_ref)
@@ -76,14 +169,9 @@ class PipelineExecutor:
 
         # Add output flags (resolved to absolute paths)
         for flag, var_ref in step.outputs.items():
-            if (
-                loop_bindings
-                and isinstance(var_ref, str)
-                and var_ref.startswith("$")
-                and var_ref[1:] in loop_bindings
-            ):
+            if loop_bindings and (bound := _loop_binding(var_ref, loop_bindings)) is not None:
                 cmd.append(flag)
-                cmd.append(loop_bindings[var_ref[1:]])
+                cmd.append(bound)
             else:
                 resolved = self.config.resolve_path(var_ref)
                 cmd.append(flag)
@@ -106,18 +194,124 @@ class PipelineExecutor:
 
         # Add extra args if provided
         if extra_args:
-            cmd.extend(extra_args.split())
+            cmd.extend(shlex.split(extra_args) if isinstance(extra_args, str) else extra_args)
 
         return cmd
 
+    def _loop_command_builder(
+        self, step: StepConfig, into_path: Path
+    ) -> Callable[[Path], list[str]]:
+        """Resolve a loop step's command once and return a per-item command builder.
+
+        Only the loop bindings differ between iterations, so inputs, outputs and
+        args (including URL downloads) are resolved a single time into a template
+        and each item just substitutes its bound values.
+
+        Args:
+            step: Loop step.
+            into_path: Resolved loop.into directory.
+
+        Returns:
+            Function mapping a file from loop.over to its command.
+        """
+        # NUL cannot appear in a real argument, so placeholders never collide
+        placeholders = {"\0loop_item": "loop_item", "\0loop_output": "loop_output"}
+        template = self.build_command(
+            step, loop_bindings={name: slot for slot, name in placeholders.items()}
+        )
+        # Argument positions to patch per item, so the rest is copied as-is
+        item_slots = [i for i, arg in enumerate(template) if placeholders.get(arg) == "loop_item"]
+        output_slots = [
+            i for i, arg in enumerate(template) if placeholders.get(arg) == "loop_output"
+        ]
+        # String concatenation; joining Paths per item costs far more
+        output_prefix = os.path.join(into_path, "")
+
+        def build(item: Path) -> list[str]:
+            cmd = template.copy()
+            if item_slots:
+                item_str = str(item)
+                for i in item_slots:
+                    cmd[i] = item_str
+            if output_slots:
+                output_str = output_prefix + item.name
+                for i in output_slots:
+                    cmd[i] = output_str
+            return cmd
+
+        return build
+
     def _ensure_output_dirs(self, step: StepConfig) -> None:
         """Create parent directories for step outputs."""
-        for var_ref in step.outputs.values():
-            output_path = self.config.resolve_path(var_ref)
-            output_path.parent.mkdir(parents=True, exist_ok=True)
+        # Outputs commonly share a directory; create each one only once
+        parents = {self.config.resolve_path(var_ref).parent for var_ref in step.outputs.values()}
+        for parent in parents - self._ready_dirs:
+            _make_dir(parent)
+
+    def _is_up_to_date(self, step: StepConfig) -> bool:
+        """Check whether a step's outputs are newer than its inputs.
+
+        Uses the editor's freshness rule: every output exists and no input was
+        modified after the oldest output. Steps without outputs and loop steps
+        (whose outputs are per item) are never up to date. Unlike the editor,
+        a missing input also makes the step stale, so it runs and reports the
+        missing file instead of being skipped. URL inputs are compared through
+        their cached download; one not downloaded yet counts as missing.
+
+        Args:
+            step: Step to check.
+
+        Returns:
+            True if running the step again would not change its outputs.
+        """
+        if not step.outputs or step.loop is not None:
+            return False
+        try:
+            oldest_output = min(
+                self.config.resolve_path(var_ref).stat().st_mtime
+                for var_ref in step.outputs.values()
+            )
+        except OSError:
+            return False
+        for var_ref in step.inputs.values():
+            if self.config.is_url_path(var_ref):
+                url = self.config.get_raw_path(var_ref)
+                path = get_cache_path(url, self.config.get_url_cache_dir())
+            else:
+                path = self.config.resolve_path(var_ref)
+            try:
+                if path.stat().st_mtime > oldest_output:
+                    return False
+            except OSError:
+                return False
+        return True
+
+    def _prepare_output_dirs(self, steps: list[StepConfig]) -> None:
+        """Create output directories for all steps before scheduling them.
+
+        Parents are collected across steps and created deepest-first, so shared
+        output roots and ancestors of an already created directory cost no extra
+        syscalls. _ensure_output_dirs skips them for the rest of the run.
+
+        Args:
+            steps: Steps about to be run.
+        """
+        self._ready_dirs.clear()
+        dirs = {
+            self.config.resolve_path(var_ref).parent
+            for step in steps
+            if step.loop is None  # loop outputs are per-item bindings
+            for var_ref in step.outputs.values()
+        }
+        for directory in sorted(dirs, key=lambda d: len(d.parts), reverse=True):
+            if directory in self._ready_dirs:
+                continue
+            _make_dir(directory)
+            self._ready_dirs.add(directory)
+            self._ready_dirs.update(directory.parents)
 
     def run_step(
-        self, step: StepConfig, extra_args: str | None = None
+        self, step: StepConfig, extra_args: str | Sequence[str] | None = None
     ) -> subprocess.CompletedProcess | None:
         """Run a single pipeline step.
 
@@ -138,7 +332,7 @@ class PipelineExecutor:
             return subprocess.CompletedProcess(args=[], returncode=0 if success else 1)
 
         cmd = self.build_command(step, extra_args)
-        cmd_str = " ".join(cmd)
+        cmd_str = shlex.join(cmd)
 
         if self.dry_run:
             print(f"[DRY RUN] {step.name}:")
@@ -146,7 +340,8 @@ class PipelineExecutor:
             return None
 
         print(f"[RUNNING] {step.name}")
-        print(f"  {cmd_str}")
+        # The child writes straight to our stdout fd; flush so a piped log keeps order
+        print(f"  {cmd_str}", flush=True)
 
         self._ensure_output_dirs(step)
 
@@ -165,20 +360,12 @@ class PipelineExecutor:
         assert loop is not None
         over_path = self.config.resolve_path(loop.over)
         into_path = self.config.resolve_path(loop.into)
-        if loop.filter:
-            files = sorted(over_path.glob(loop.filter)) if over_path.exists() else []
-        else:
-            files = (
-                sorted(f for f in over_path.iterdir() if f.is_file()) if over_path.exists() else []
-            )
+        files = _list_loop_files(over_path, loop.filter) if over_path.exists() else []
         print(f"[DRY RUN] {step.name} (loop: {len(files)} items):")
+        build = self._loop_command_builder(step, into_path)
         for f in files:
-            loop_bindings = {
-                "loop_item": str(f),
-                "loop_output": str(into_path / f.name),
-            }
-            cmd = self.build_command(step, loop_bindings=loop_bindings)
-            print(f"  item {f.name}: {' '.join(cmd)}")
+            cmd = build(f)
+            print(f"  item {f.name}: {shlex.join(cmd)}")
 
     def run_loop_step(self, step: StepConfig) -> bool:
         """Execute a loop step, running the task for each item in the collection.
@@ -199,10 +386,7 @@ class PipelineExecutor:
             return False
 
         # Enumerate files, optionally filtered
-        if loop.filter:
-            files = sorted(over_path.glob(loop.filter))
-        else:
-            files = sorted(f for f in over_path.iterdir() if f.is_file())
+        files = _list_loop_files(over_path, loop.filter)
 
         if not files:
             print(f"[RUNNING] {step.name} (loop: no files to process)")
@@ -214,13 +398,12 @@ class PipelineExecutor:
 
         # Determine whether to run iterations in parallel
         use_parallel = loop.parallel if loop.parallel is not None else self.config.parallel
-        max_workers = self.config.max_workers or 4
 
         mode = f"loop: {len(files)} items" + (", parallel" if use_parallel else "")
         print(f"[RUNNING] {step.name} ({mode})")
 
         if use_parallel:
-            success = self._run_loop_iterations_parallel(step, files, into_path, max_workers)
+            success = self._run_loop_iterations_parallel(step, files, into_path)
         else:
             success = self._run_loop_iterations_sequential(step, files, into_path)
 
@@ -236,13 +419,10 @@ class PipelineExecutor:
     ) -> bool:
         """Run loop iterations one at a time."""
         total = len(files)
+        build = self._loop_command_builder(step, into_path)
         for i, f in enumerate(files):
-            loop_bindings = {
-                "loop_item": str(f),
-                "loop_output": str(into_path / f.name),
-            }
-            cmd = self.build_command(step, loop_bindings=loop_bindings)
-            print(f"  [{i + 1}/{total}] {f.name}")
+            cmd = build(f)
+            print(f"  [{i + 1}/{total}] {f.name}", flush=True)
             result = subprocess.run(cmd, capture_output=False)
             if result.returncode != 0:
                 print(f"  [FAILED] item {f.name} (exit code {result.returncode})")
@@ -250,42 +430,126 @@ class PipelineExecutor:
         return True
 
     def _run_loop_iterations_parallel(
-        self, step: StepConfig, files: list[Path], into_path: Path, max_workers: int
+        self, step: StepConfig, files: list[Path], into_path: Path
     ) -> bool:
         """Run loop iterations concurrently."""
+        build = self._loop_command_builder(step, into_path)
 
         def run_item(f: Path) -> tuple[str, bool, str]:
-            loop_bindings = {
-                "loop_item": str(f),
-                "loop_output": str(into_path / f.name),
-            }
-            cmd = self.build_command(step, loop_bindings=loop_bindings)
-            result = subprocess.run(cmd, capture_output=True, text=True)
-            output_lines: list[str] = []
-            if result.stdout:
-                for line in result.stdout.rstrip().split("\n"):
-                    if line:
-                        output_lines.append(f"[{step.name}/{f.name}] {line}")
-            if result.stderr:
-                for line in result.stderr.rstrip().split("\n"):
-                    if line:
-                        output_lines.append(f"[{step.name}/{f.name}] {line}")
-            return f.name, result.returncode == 0, "\n".join(output_lines)
+            success, output_lines = self._run_loop_item_captured(step, f, build(f))
+            return f.name, success, "\n".join(output_lines)
 
         all_success = True
-        with ThreadPoolExecutor(max_workers=max_workers) as pool:
-            futures = [pool.submit(run_item, f) for f in files]
-            for future in futures:
-                item_name, item_success, output = future.result()
-                with _print_lock:
-                    if output:
-                        print(output)
-                    if not item_success:
-                        print(f"  [FAILED] item {item_name}")
+        pool = self._loop_item_pool()
+        futures = [pool.submit(run_item, f) for f in files]
+        for future in futures:
+            item_name, item_success, output = future.result()
+            with _print_lock:
+                if output:
+                    print(output)
                 if not item_success:
-                    all_success = False
+                    print(f"  [FAILED] item {item_name}")
+            if not item_success:
+                all_success = False
         return all_success
 
+    def _loop_item_pool(self) -> ThreadPoolExecutor:
+        """Return the shared loop item pool, starting it on first use.
+
+        Loop steps reuse one pool instead of spinning up threads per step. It is
+        kept apart from the pipeline-level pool: a loop step waits on its items,
+        so queueing them behind pipeline steps could deadlock.
+        """
+        with self._item_pool_lock:
+            if self._item_pool is None:
+                self._item_pool = ThreadPoolExecutor(
+                    max_workers=self.config.max_workers or 4, thread_name_prefix="loom-item"
+                )
+            return self._item_pool
+
+    def close(self) -> None:
+        """Shut down the loop item pool; it is started again if needed."""
+        with self._item_pool_lock:
+            pool, self._item_pool = self._item_pool, None
+        if pool is not None:
+            pool.shutdown(wait=True)
+
+    def _run_captured(self, cmd: list[str], prefix: str, output_lines: list[str]) -> int:
+        """Run a command, appending its output lines tagged with a prefix.
+
+        stderr is merged into stdout, so lines keep the order the child wrote them,
+        and the pipe is read line by line instead of buffering the whole output
+        before splitting it. The child holds one of the shared subprocess slots
+        and is tracked until it exits, so _interrupt() can stop it. Once an
+        interrupt has begun, no new child is started and 1 is returned instead.
+
+        Args:
+            cmd: Command to run.
+            prefix: Tag shown in brackets before each line.
+            output_lines: List the non-empty lines are appended to.
+
+        Returns:
+            The command's exit code.
+        """
+        with self._subprocess_slots:
+            # A thread that waited for its slot through an interrupt must not spawn
+            with self._live_procs_lock:
+                if self._stopping.is_set():
+                    return 1
+            proc = subprocess.Popen(
+                cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True
+            )
+            with self._live_procs_lock:
+                if self._stopping.is_set():
+                    # _interrupt() ran while this child was starting and missed it
+                    proc.terminate()
+                else:
+                    self._live_procs.add(proc)
+            with proc:
+                try:
+                    assert proc.stdout is not None
+                    for line in proc.stdout:
+                        line = line.rstrip("\n")
+                        if line:
+                            output_lines.append(f"[{prefix}] {line}")
+                finally:
+                    with self._live_procs_lock:
+                        self._live_procs.discard(proc)
+        return proc.returncode
+
+    def _interrupt(self) -> None:
+        """Stop captured work after Ctrl-C: drop queued loop items, end live children.
+
+        Children share the terminal's process group, so a Ctrl-C at the terminal
+        already reached them; this also covers scripts that catch SIGINT and
+        interrupts delivered to the runner alone.
+        """
+        with self._item_pool_lock:
+            if self._item_pool is not None:
+                self._item_pool.shutdown(wait=False, cancel_futures=True)
+        with self._live_procs_lock:
+            self._stopping.set()
+            procs = list(self._live_procs)
+        for proc in procs:
+            proc.terminate()
+
+    def _run_loop_item_captured(
+        self, step: StepConfig, item: Path, cmd: list[str]
+    ) -> tuple[bool, list[str]]:
+        """Run a single loop iteration with captured output.
+
+        Args:
+            step: Loop step.
+            item: File from the loop.over collection.
+            cmd: Command for this item.
+
+        Returns:
+            Tuple of (success, output lines prefixed with step and item name).
+        """
+        output_lines: list[str] = []
+        returncode = self._run_captured(cmd, f"{step.name}/{item.name}", output_lines)
+        return returncode == 0, output_lines
+
     def _get_steps_to_run(
         self,
         steps: list[str] | None = None,
@@ -304,8 +568,7 @@ class PipelineExecutor:
         Returns:
             List of steps to run in order.
         """
-        orch = PipelineOrchestrator(self.config)
-        return orch.get_steps_to_run(steps, from_step, include_optional)
+        return self._planner.get_steps_to_run(steps, from_step, include_optional)
 
     def _can_run_step(self, step: StepConfig) -> bool:
         """Check if step can run based on dependency results.
@@ -338,11 +601,10 @@ class PipelineExecutor:
         Returns:
             Tuple of (dependencies, dependents) dicts.
         """
-        orch = PipelineOrchestrator(self.config)
-        return orch.build_dependency_graph(steps)
+        return self._planner.build_dependency_graph(steps)
 
     def _run_step_parallel(
-        self, step: StepConfig, extra_args: str | None = None
+        self, step: StepConfig, extra_args: str | Sequence[str] | None = None
     ) -> tuple[str, bool, str]:
         """Run a single step with captured output for pipeline-level parallel execution.
 
@@ -361,7 +623,7 @@ class PipelineExecutor:
             return self._run_loop_step_captured(step)
 
         cmd = self.build_command(step, extra_args)
-        cmd_str = " ".join(cmd)
+        cmd_str = shlex.join(cmd)
         output_lines: list[str] = []
 
         if self.dry_run:
@@ -374,30 +636,15 @@ class PipelineExecutor:
 
         self._ensure_output_dirs(step)
 
-        # Capture output for parallel execution
-        result = subprocess.run(
-            cmd,
-            capture_output=True,
-            text=True,
-        )
-
-        # Prefix each output line with step name
-        if result.stdout:
-            for line in result.stdout.rstrip().split("\n"):
-                if line:
-                    output_lines.append(f"[{step.name}] {line}")
-
-        if result.stderr:
-            for line in result.stderr.rstrip().split("\n"):
-                if line:
-                    output_lines.append(f"[{step.name}] {line}")
+        # Capture output for parallel execution, prefixing each line with the step name
+        returncode = self._run_captured(cmd, step.name, output_lines)
 
-        if result.returncode == 0:
+        if returncode == 0:
             output_lines.append(f"[SUCCESS] {step.name}")
         else:
-            output_lines.append(f"[FAILED] {step.name} (exit code {result.returncode})")
+            output_lines.append(f"[FAILED] {step.name} (exit code {returncode})")
 
-        return step.name, result.returncode == 0, "\n".join(output_lines)
+        return step.name, returncode == 0, "\n".join(output_lines)
 
     def _run_loop_step_captured(self, step: StepConfig) -> tuple[str, bool, str]:
         """Run a loop step with captured output, for use in parallel pipeline execution.
@@ -418,10 +665,7 @@ class PipelineExecutor:
             msg = f"[FAILED] {step.name}: loop.over directory does not exist: {over_path}"
             return step.name, False, msg
 
-        if loop.filter:
-            files = sorted(over_path.glob(loop.filter))
-        else:
-            files = sorted(f for f in over_path.iterdir() if f.is_file())
+        files = _list_loop_files(over_path, loop.filter)
 
         if not files:
             output_lines.append(f"[RUNNING] {step.name} (loop: no files to process)")
@@ -436,25 +680,27 @@ class PipelineExecutor:
         output_lines.append(f"[RUNNING] {step.name} ({mode})")
 
         all_success = True
-        for f in files:
-            loop_bindings = {
-                "loop_item": str(f),
-                "loop_output": str(into_path / f.name),
-            }
-            cmd = self.build_command(step, loop_bindings=loop_bindings)
-            result = subprocess.run(cmd, capture_output=True, text=True)
-            if result.stdout:
-                for line in result.stdout.rstrip().split("\n"):
-                    if line:
-                        output_lines.append(f"[{step.name}/{f.name}] {line}")
-            if result.stderr:
-                for line in result.stderr.rstrip().split("\n"):
-                    if line:
-                        output_lines.append(f"[{step.name}/{f.name}] {line}")
-            if result.returncode != 0:
-                output_lines.append(f"  [FAILED] item {f.name}")
-                all_success = False
-                break
+        build = self._loop_command_builder(step, into_path)
+        if use_parallel:
+            # Iterations are independent, so launch them concurrently like run_loop_step
+            item_results = list(
+                self._loop_item_pool().map(
+                    lambda f: self._run_loop_item_captured(step, f, build(f)), files
+                )
+            )
+            for f, (item_success, item_lines) in zip(files, item_results, strict=True):
+                output_lines.extend(item_lines)
+                if not item_success:
+                    output_lines.append(f"  [FAILED] item {f.name}")
+                    all_success = False
+        else:
+            for f in files:
+                item_success, item_lines = self._run_loop_item_captured(step, f, build(f))
+                output_lines.extend(item_lines)
+                if not item_success:
+                    output_lines.append(f"  [FAILED] item {f.name}")
+                    all_success = False
+                    break
 
         if all_success:
             output_lines.append(f"[SUCCESS] {step.name}")
@@ -468,7 +714,7 @@ class PipelineExecutor:
         steps: list[str] | None = None,
         from_step: str | None = None,
         include_optional: list[str] | None = None,
-        extra_args: dict[str, str] | None = None,
+        extra_args: Mapping[str, str | Sequence[str]] | None = None,
     ) -> dict[str, bool]:
         """Run pipeline steps using the shared orchestrator.
 
@@ -476,17 +722,20 @@ class PipelineExecutor:
             steps: Specific step names to run.
             from_step: Run from this step onward.
             include_optional: Optional steps to include.
-            extra_args: Extra arguments per step {step_name: args_string}.
+            extra_args: Extra arguments per step {step_name: args}, as token lists
+                or strings.
 
         Returns:
             Dict of step_name -> success status.
         """
         extra_args = extra_args or {}
 
+        # The orchestrator must not release more steps than the pool runs at once
         orch = PipelineOrchestrator(
             self.config,
             parallel=self.config.parallel,
-            max_workers=self.config.max_workers,
+            max_workers=self.config.max_workers or 4,
+            fail_fast=self.fail_fast,
         )
 
         # Get steps to run for display
@@ -506,15 +755,21 @@ class PipelineExecutor:
             print(f"\nPipeline: {len(steps_to_run)} step(s) to run")
         print("-" * 40)
 
+        if not self.dry_run:
+            self._prepare_output_dirs(steps_to_run)
+
         # Run using orchestrator
-        if self.config.parallel:
-            self._run_with_orchestrator_parallel(
-                orch, steps, from_step, include_optional, extra_args
-            )
-        else:
-            self._run_with_orchestrator_sequential(
-                orch, steps, from_step, include_optional, extra_args
-            )
+        self._stopping.clear()
+        try:
+            if self.config.parallel:
+                self._run_with_orchestrator_parallel(orch, steps_to_run, extra_args)
+            else:
+                self._run_with_orchestrator_sequential(orch, steps_to_run, extra_args)
+        except KeyboardInterrupt:
+            self._interrupt()
+            raise
+        finally:
+            self.close()
 
         # Copy results from orchestrator
         self._results = orch.results
@@ -529,21 +784,17 @@ class PipelineExecutor:
     def _run_with_orchestrator_sequential(
         self,
         orch: PipelineOrchestrator,
-        steps: list[str] | None,
-        from_step: str | None,
-        include_optional: list[str] | None,
-        extra_args: dict[str, str],
+        steps_to_run: list[StepConfig],
+        extra_args: Mapping[str, str | Sequence[str]],
     ) -> None:
         """Run pipeline sequentially using orchestrator.
 
         Args:
             orch: Pipeline orchestrator.
-            steps: Specific step names to run.
-            from_step: Run from this step onward.
-            include_optional: Optional steps to include.
+            steps_to_run: Steps selected by orch.get_steps_to_run().
             extra_args: Extra arguments per step.
         """
-        gen = orch.orchestrate(steps, from_step, include_optional)
+        gen = orch.orchestrate_steps(steps_to_run)
 
         event = next(gen)
         while event.type != EventType.PIPELINE_COMPLETE:
@@ -553,6 +804,11 @@ class PipelineExecutor:
                 assert event.step_name is not None
                 step = event.step
                 step_name = event.step_name
+                if self.incremental and not self.dry_run and self._is_up_to_date(step):
+                    print(f"[UP TO DATE] {step_name}")
+                    event = gen.send(StepResult(step_name, True))
+                    continue
+
                 step_extra = extra_args.get(step_name)
                 result = self.run_step(step, step_extra)
 
@@ -564,7 +820,7 @@ class PipelineExecutor:
                 event = gen.send(StepResult(step_name, success))
 
             elif event.type == EventType.STEP_SKIPPED:
-                print(f"[SKIPPED] {event.step_name} (dependencies failed: {event.failed_deps})")
+                print(_skip_message(event.step_name, event.failed_deps))
                 event = next(gen)
 
             else:
@@ -573,26 +829,23 @@ class PipelineExecutor:
     def _run_with_orchestrator_parallel(
         self,
         orch: PipelineOrchestrator,
-        steps: list[str] | None,
-        from_step: str | None,
-        include_optional: list[str] | None,
-        extra_args: dict[str, str],
+        steps_to_run: list[StepConfig],
+        extra_args: Mapping[str, str | Sequence[str]],
     ) -> None:
         """Run pipeline in parallel using orchestrator.
 
         Args:
             orch: Pipeline orchestrator.
-            steps: Specific step names to run.
-            from_step: Run from this step onward.
-            include_optional: Optional steps to include.
+            steps_to_run: Steps selected by orch.get_steps_to_run().
             extra_args: Extra arguments per step.
         """
-        gen = orch.orchestrate(steps, from_step, include_optional)
-        running: dict[str, Future[tuple[str, bool, str]]] = {}
+        gen = orch.orchestrate_steps(steps_to_run)
+        # Submission-ordered map of in-flight futures to their step names
+        running: dict[Future[tuple[str, bool, str]], str] = {}
         step_map: dict[str, StepConfig] = {}
 
-        max_workers = self.config.max_workers or 4
-        executor = ThreadPoolExecutor(max_workers=max_workers)
+        # Sized like the orchestrator, so every released step starts right away
+        executor = ThreadPoolExecutor(max_workers=orch.max_workers)
 
         try:
             event = next(gen)
@@ -604,41 +857,52 @@ class PipelineExecutor:
                     step = event.step
                     step_name = event.step_name
                     step_map[step_name] = step
-                    step_extra = extra_args.get(step_name)
-                    future = executor.submit(self._run_step_parallel, step, step_extra)
-                    running[step_name] = future
+                    if self.incremental and not self.dry_run and self._is_up_to_date(step):
+                        # Report through the normal completion path without a worker
+                        future: Future[tuple[str, bool, str]] = Future()
+                        future.set_result((step_name, True, f"[UP TO DATE] {step_name}"))
+                    else:
+                        step_extra = extra_args.get(step_name)
+                        future = executor.submit(self._run_step_parallel, step, step_extra)
+                    running[future] = step_name
                     event = next(gen)
 
                 elif event.type == EventType.STEP_SKIPPED:
                     with _print_lock:
-                        print(
-                            f"[SKIPPED] {event.step_name} (dependencies failed: {event.failed_deps})"
-                        )
+                        print(_skip_message(event.step_name, event.failed_deps))
                     event = next(gen)
 
                 elif event.type == EventType.WAITING:
-                    # Wait for at least one task to complete
-                    done_name = None
-                    while done_name is None:
-                        for name, future in list(running.items()):
-                            if future.done():
-                                done_name = name
-                                break
-                        if done_name is None:
-                            _wait_brief()
-
-                    future = running.pop(done_name)
+                    # Block until at least one task completes; report the earliest
+                    # submitted of those done so simultaneous finishes keep an order
+                    done, _ = wait(running, return_when=FIRST_COMPLETED)
+                    future = next(f for f in running if f in done)
+                    step_name = running.pop(future)
+                    if future.cancelled():
+                        event = gen.send(StepResult(step_name, False, skipped=True))
+                        continue
                     step_name, success, output = future.result()
 
                     # Print output atomically
                     with _print_lock:
                         print(output)
 
+                    if self.fail_fast and not success:
+                        # Steps still queued in the pool never start
+                        for pending in running:
+                            pending.cancel()
+
                     event = gen.send(StepResult(step_name, success))
 
                 else:
                     event = next(gen)
 
+        except KeyboardInterrupt:
+            # Drop queued steps and stop running ones so the shutdown below returns
+            executor.shutdown(wait=False, cancel_futures=True)
+            self._interrupt()
+            raise
+
         finally:
             executor.shutdown(wait=True)
 
@@ -654,15 +918,19 @@ def parse_key_value_args(args: list[str]) -> dict[str, Any]:
     """
     result: dict[str, Any] = {}
     for arg in args:
-        if "=" not in arg:
+        key, sep, value = arg.partition("=")
+        if not sep:
             raise ValueError(f"Invalid format: {arg}. Expected key=value")
-        key, value = arg.split("=", 1)
 
         # Try to parse as number or bool
-        if value.lower() == "true":
+        lowered = value.lower()
+        if lowered == "true":
             result[key] = True
-        elif value.lower() == "false":
+        elif lowered == "false":
             result[key] = False
+        elif (head := value[:1]).isascii() and head not in _NUMBER_STARTS:
+            # Plain strings (paths, names) can never convert; skip the failing int()
+            result[key] = value
         else:
             try:
                 result[key] = float(value) if "." in value else int(value)
@@ -8,11 +8,13 @@ The orchestrator handles:
 - Building dependency graphs from step configurations
 - Determining which steps are ready to run (all deps satisfied)
 - Tracking step results (success/failure)
-- Skipping dependent steps when dependencies fail
+- Skipping dependent steps when dependencies fail (or all remaining steps
+  in fail-fast mode)
 - Both sequential and parallel execution modes
 """
 
 import os
+from collections import deque
 from collections.abc import Generator
 from dataclasses import dataclass
 from enum import Enum
@@ -53,10 +55,13 @@ class StepResult:
     Attributes:
         step_name: Name of the completed step.
         success: Whether the step succeeded.
+        skipped: True if the step was released but never ran (e.g. cancelled
+            after a fail_fast failure); the step is then reported as skipped.
     """
 
     step_name: str
     success: bool
+    skipped: bool = False
 
 
 # Type alias for the orchestrator generator
@@ -110,6 +115,7 @@ class PipelineOrchestrator:
         config: PipelineConfig,
         parallel: bool = False,
         max_workers: int | None = None,
+        fail_fast: bool = False,
     ) -> None:
         """Initialize orchestrator with pipeline configuration.
 
@@ -117,11 +123,16 @@ class PipelineOrchestrator:
             config: Pipeline configuration with steps and dependencies.
             parallel: If True, yield all ready steps at once (parallel mode).
             max_workers: Maximum concurrent steps in parallel mode.
+            fail_fast: If True, skip every step not yet started once any step
+                fails, not only its dependents. Steps already running finish.
         """
         self.config = config
         self.parallel = parallel
         self.max_workers = max_workers or os.cpu_count() or 4
+        self.fail_fast = fail_fast
         self._results: dict[str, bool] = {}
+        # Steps recorded as failed or skipped, for the dependency check
+        self._failed: set[str] = set()
 
     def build_dependency_graph(
         self, steps: list[StepConfig]
@@ -141,16 +152,14 @@ class PipelineOrchestrator:
         dependents: dict[str, set[str]] = {}
 
         for step in steps:
-            # Get dependencies, but only include steps that are in our run list
-            step_deps = self.config.get_step_dependencies(step)
-            dependencies[step.name] = step_deps & step_names
-            dependents[step.name] = set()
-
-        # Build reverse mapping (dependents)
-        for step_name, deps in dependencies.items():
-            for dep in deps:
-                if dep in dependents:
-                    dependents[dep].add(step_name)
+            # Both directions are precomputed on the config; keep only edges
+            # between steps in our run list, and no self-edges (in-place steps)
+            step_deps = step_names.intersection(self.config.get_step_dependencies(step))
+            step_deps.discard(step.name)
+            dependencies[step.name] = step_deps
+            dependents[step.name] = step_names.intersection(
+                self.config.get_step_dependents(step.name)
+            )
 
         return dependencies, dependents
 
@@ -170,34 +179,24 @@ class PipelineOrchestrator:
         Returns:
             List of steps to run in order.
         """
-        include_optional = include_optional or []
-
         if steps:
             # Run only specified steps
             return [self.config.get_step_by_name(name) for name in steps]
 
-        # Get all steps, filtering optional ones
-        result = []
-        started = from_step is None
-
-        for step in self.config.steps:
-            if step.name == from_step:
-                started = True
-
-            if not started:
-                continue
-
-            # Skip disabled steps
-            if step.disabled:
-                continue
-
-            # Skip optional steps unless explicitly included
-            if step.optional and step.name not in include_optional:
-                continue
-
-            result.append(step)
-
-        return result
+        start = 0
+        if from_step is not None:
+            try:
+                start = self.config.get_step_index(from_step)
+            except ValueError:
+                return []
+
+        # Get all steps from the start point, filtering disabled and optional ones
+        optional_included = frozenset(include_optional or ())
+        return [
+            step
+            for step in self.config.steps[start:]
+            if not step.disabled and (not step.optional or step.name in optional_included)
+        ]
 
     def orchestrate(
         self,
@@ -229,8 +228,20 @@ class PipelineOrchestrator:
                 else:
                     event = next(gen)
         """
-        steps_to_run = self.get_steps_to_run(steps, from_step, include_optional)
+        yield from self.orchestrate_steps(self.get_steps_to_run(steps, from_step, include_optional))
+
+    def orchestrate_steps(self, steps_to_run: list[StepConfig]) -> OrchestratorGenerator:
+        """Orchestrate an already selected list of steps.
+
+        Same events as orchestrate(), for callers that have already called
+        get_steps_to_run() and should not filter the pipeline a second time.
+
+        Args:
+            steps_to_run: Steps to execute, in definition order.
 
+        Yields:
+            OrchestratorEvent objects.
+        """
         if not steps_to_run:
             yield OrchestratorEvent(type=EventType.PIPELINE_COMPLETE)
             return
@@ -249,12 +260,13 @@ class PipelineOrchestrator:
         Yields:
             OrchestratorEvent for each step (STEP_READY or STEP_SKIPPED).
         """
+        stopped = False
         for step in steps:
             # Check if we can run this step
-            if not self._can_run_step(step):
+            if stopped or not self._can_run_step(step):
                 deps = self.config.get_step_dependencies(step)
-                failed_deps = [d for d in deps if self._results.get(d) is False]
-                self._results[step.name] = False
+                failed_deps = [d for d in deps if d in self._failed]
+                self._record_result(step.name, False)
                 yield OrchestratorEvent(
                     type=EventType.STEP_SKIPPED,
                     step_name=step.name,
@@ -273,85 +285,97 @@ class PipelineOrchestrator:
 
             # Record result
             if isinstance(result, StepResult):
-                self._results[result.step_name] = result.success
+                self._record_result(result.step_name, result.success)
+                stopped = self.fail_fast and not result.success
             else:
                 # Default to success if no result sent (shouldn't happen)
-                self._results[step.name] = True
+                self._record_result(step.name, True)
 
         yield OrchestratorEvent(type=EventType.PIPELINE_COMPLETE)
 
     def _orchestrate_parallel(self, steps: list[StepConfig]) -> OrchestratorGenerator:
         """Parallel execution: yield all ready steps, wait for completions.
 
+        Readiness is tracked with per-step counters of unfinished dependencies,
+        so a completion only touches the steps that depend on it instead of
+        rescanning everything still pending. Ready steps are released in
+        pipeline definition order.
+
         Args:
             steps: List of steps to execute.
 
         Yields:
             OrchestratorEvent for ready steps, skip events, and WAITING events.
         """
-        dependencies, _ = self.build_dependency_graph(steps)
+        dependencies, dependents = self.build_dependency_graph(steps)
         step_map = {s.name: s for s in steps}
+        position = {name: i for i, name in enumerate(step_map)}
 
-        pending = set(step_map.keys())
-        completed: set[str] = set()
+        # Number of dependencies each step is still waiting on
+        waiting_on = {name: len(deps) for name, deps in dependencies.items()}
+        ready = deque(name for name in step_map if not waiting_on[name])
         failed: set[str] = set()
         skipped: set[str] = set()
         running: set[str] = set()
+        started: set[str] = set()
 
-        while pending or running:
-            # Find ready steps (all dependencies completed successfully)
-            ready: list[str] = []
-            to_skip: list[str] = []
-
-            for name in list(pending):
-                deps = dependencies[name]
-                # Check if any dependency failed or was skipped
-                if deps & (failed | skipped):
-                    to_skip.append(name)
-                elif deps <= completed:
-                    # Check max_workers limit (account for both running and already-ready steps)
-                    if len(running) + len(ready) < self.max_workers:
-                        ready.append(name)
-
-            # Yield skip events
-            for name in to_skip:
-                pending.remove(name)
-                skipped.add(name)
-                self._results[name] = False
-                deps = dependencies[name]
-                failed_deps = list(deps & (failed | skipped))
-                yield OrchestratorEvent(
-                    type=EventType.STEP_SKIPPED,
-                    step_name=name,
-                    step=step_map[name],
-                    failed_deps=failed_deps,
-                )
-
-            # Yield ready steps
-            for name in ready:
-                pending.remove(name)
+        while ready or running:
+            # Release ready steps up to the max_workers limit
+            while ready and len(running) < self.max_workers:
+                name = ready.popleft()
                 running.add(name)
+                started.add(name)
                 yield OrchestratorEvent(
                     type=EventType.STEP_READY,
                     step_name=name,
                     step=step_map[name],
                 )
 
-            # If we have running tasks, yield WAITING and expect a result
-            if running:
-                result = yield OrchestratorEvent(type=EventType.WAITING)
-
-                if isinstance(result, StepResult):
-                    running.discard(result.step_name)
-                    self._results[result.step_name] = result.success
-                    if result.success:
-                        completed.add(result.step_name)
-                    else:
-                        failed.add(result.step_name)
-            elif not pending:
-                # No running tasks and no pending tasks, we're done
+            if not running:
+                # Nothing can make progress (e.g. a dependency cycle)
                 break
 
+            result = yield OrchestratorEvent(type=EventType.WAITING)
+            if not isinstance(result, StepResult) or result.step_name not in running:
+                continue
+
+            name = result.step_name
+            running.remove(name)
+            self._record_result(name, result.success)
+
+            if result.success:
+                for child in sorted(dependents[name], key=position.__getitem__):
+                    waiting_on[child] -= 1
+                    if not waiting_on[child] and child not in skipped:
+                        ready.append(child)
+                continue
+
+            if result.skipped:
+                # The caller dropped the step before it ran; skip it and its dependents
+                to_skip = deque([name])
+            else:
+                # Skip everything downstream of the failed step, or with fail_fast
+                # everything that has not started yet
+                failed.add(name)
+                if self.fail_fast:
+                    ready.clear()
+                    to_skip = deque(n for n in step_map if n not in started)
+                else:
+                    to_skip = deque(sorted(dependents[name], key=position.__getitem__))
+            while to_skip:
+                child = to_skip.popleft()
+                if child in skipped:
+                    continue
+                skipped.add(child)
+                self._record_result(child, False)
+                yield OrchestratorEvent(
+                    type=EventType.STEP_SKIPPED,
+                    step_name=child,
+                    step=step_map[child],
+                    failed_deps=list(dependencies[child] & (failed | skipped)),
+                )
+                to_skip.extend(sorted(dependents[child], key=position.__getitem__))
+
         yield OrchestratorEvent(type=EventType.PIPELINE_COMPLETE)
 
     def _can_run_step(self, step: StepConfig) -> bool:
@@ -363,14 +387,15 @@ class PipelineOrchestrator:
         Returns:
             True if all dependencies succeeded or weren't run.
         """
-        dependencies = self.config.get_step_dependencies(step)
+        return self._failed.isdisjoint(self.config.get_step_dependencies(step))
 
-        for dep_name in dependencies:
-            # If dependency was run and failed, we can't run this step
-            if dep_name in self._results and not self._results[dep_name]:
-                return False
-
-        return True
+    def _record_result(self, name: str, success: bool) -> None:
+        """Record a step's outcome, tracking failures for _can_run_step."""
+        self._results[name] = success
+        if success:
+            self._failed.discard(name)
+        else:
+            self._failed.add(name)
 
     @property
     def results(self) -> dict[str, bool]:
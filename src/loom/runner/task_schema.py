@@ -70,6 +70,9 @@ from typing import Any
 
 import yaml
 
+# libyaml-backed loader (falls back to pure Python if PyYAML was built without it)
+_SafeLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 
 @dataclass
 class ArgSchema:
@@ -173,7 +176,7 @@ def parse_frontmatter(docstring: str) -> dict | None:
         return None
 
     try:
-        result = yaml.safe_load(match.group(1))
+        result = yaml.load(match.group(1), Loader=_SafeLoader)
         return dict(result) if result else None
     except yaml.YAMLError:
         return None
@@ -1,15 +1,18 @@
 """URL handling utilities for data node paths."""
 
 import hashlib
+import os
+import threading
 from dataclasses import dataclass
 from pathlib import Path
 from urllib.parse import urlparse
 
-import requests
-
 # Cache directory name for downloaded URLs
 URL_CACHE_DIR_NAME = ".loom-url-cache"
 
+# Schemes recognised as remote data paths
+_URL_PREFIXES = ("http://", "https://")
+
 # Default timeout for HTTP requests (in seconds)
 DEFAULT_TIMEOUT = 30
 
@@ -18,6 +21,10 @@ DEFAULT_HEADERS = {
     "User-Agent": "Loom/1.0 (https://github.com/relja/loom; Pipeline runner)",
 }
 
+# Per cache file locks, so parallel steps sharing a URL download it once
+_download_locks: dict[Path, threading.Lock] = {}
+_download_locks_guard = threading.Lock()
+
 
 def is_url(path: str) -> bool:
     """Check if a path is an HTTP/HTTPS URL.
@@ -28,7 +35,7 @@ def is_url(path: str) -> bool:
     Returns:
         True if the path starts with http:// or https://.
     """
-    return path.startswith("http://") or path.startswith("https://")
+    return path.startswith(_URL_PREFIXES)
 
 
 def get_url_filename(url: str) -> str:
@@ -81,6 +88,9 @@ def check_url_exists(url: str, timeout: int = DEFAULT_TIMEOUT) -> bool:
     Returns:
         True if the URL returns a successful status code.
     """
+    # Imported lazily: requests dominates CLI startup time and most runs never hit the network
+    import requests
+
     try:
         response = requests.head(
             url, timeout=timeout, allow_redirects=True, headers=DEFAULT_HEADERS
@@ -127,17 +137,45 @@ def download_url(
             from_cache=True,
         )
 
+    with _download_lock(cache_path):
+        # Another thread may have fetched the file while we waited for the lock
+        if not force and cache_path.exists():
+            return UrlCacheResult(
+                success=True,
+                local_path=cache_path,
+                from_cache=True,
+            )
+        return _download_to_cache(url, cache_path, timeout)
+
+
+def _download_lock(cache_path: Path) -> threading.Lock:
+    """Return the lock serializing downloads into a cache file."""
+    with _download_locks_guard:
+        return _download_locks.setdefault(cache_path, threading.Lock())
+
+
+def _download_to_cache(url: str, cache_path: Path, timeout: int) -> UrlCacheResult:
+    """Download a URL into its cache file.
+
+    The body is written to a temporary file next to the cache file and renamed
+    into place once complete, so the cache file only ever exists in full and an
+    interrupted download is not later mistaken for a cached one.
+    """
+    import requests
+
     # Ensure cache directory exists
-    cache_dir.mkdir(parents=True, exist_ok=True)
+    cache_path.parent.mkdir(parents=True, exist_ok=True)
+    partial_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.part")
 
     try:
         response = requests.get(url, timeout=timeout, stream=True, headers=DEFAULT_HEADERS)
         response.raise_for_status()
 
-        # Write to cache file
-        with open(cache_path, "wb") as f:
+        # Write to a temporary file, then move it over the cache file
+        with open(partial_path, "wb") as f:
             for chunk in response.iter_content(chunk_size=8192):
                 f.write(chunk)
+        os.replace(partial_path, cache_path)
 
         return UrlCacheResult(
             success=True,
@@ -152,6 +190,10 @@ def download_url(
             error=str(e),
         )
 
+    finally:
+        # Already renamed on success; removes the leftovers of a failed download
+        partial_path.unlink(missing_ok=True)
+
 
 def ensure_url_downloaded(url: str, cache_dir: Path) -> Path:
     """Download URL if needed and return local path.
@@ -4,6 +4,7 @@ Bridges the editor server with the runner module to build commands for
 PTY-based execution without reimplementing command building logic.
 """
 
+from collections import deque
 from pathlib import Path
 
 from loom.runner import PipelineConfig, PipelineExecutor, StepConfig
@@ -80,36 +81,9 @@ def _get_steps_to_produce_data(
     if not producing_step:
         raise ValueError(f"No step produces data '{data_name}'")
 
-    # Build dependency graph: which variables does each step need?
-    # Then trace back from producing_step to find all required steps
-    all_steps = list(config.steps)
-    step_by_name = {s.name: s for s in all_steps}
-
-    # Map variable -> step that produces it
-    var_producers: dict[str, str] = {}
-    for step in all_steps:
-        for out_ref in step.outputs.values():
-            if out_ref.startswith("$"):
-                var_producers[out_ref[1:]] = step.name
-
-    # Find all steps needed (BFS from producing_step backwards)
-    needed_steps: set[str] = {producing_step.name}
-    queue = [producing_step]
-
-    while queue:
-        step = queue.pop(0)
-        # Check what variables this step needs as inputs
-        for in_ref in step.inputs.values():
-            if in_ref.startswith("$"):
-                var_name = in_ref[1:]
-                if var_name in var_producers:
-                    dep_step_name = var_producers[var_name]
-                    if dep_step_name not in needed_steps:
-                        needed_steps.add(dep_step_name)
-                        queue.append(step_by_name[dep_step_name])
-
-    # Get steps in pipeline order (preserving execution order)
-    steps = [s for s in all_steps if s.name in needed_steps]
+    # Trace back through the config's precomputed dependency edges, which also
+    # cover loop.over/loop.into, and keep pipeline order
+    steps = _get_steps_to_step(config, producing_step.name)
 
     # Optionally filter out steps whose outputs already exist
     if skip_completed:
@@ -132,18 +106,17 @@ def _get_steps_to_step(config: PipelineConfig, step_name: str) -> list[StepConfi
         List of steps in pipeline definition order (target step included).
     """
     target_step = config.get_step_by_name(step_name)
-    step_by_name = {s.name: s for s in config.steps}
 
     # BFS backwards from target step using PipelineConfig's dependency resolution
     needed_steps: set[str] = {target_step.name}
-    queue = [target_step]
+    queue = deque([target_step])
 
     while queue:
-        step = queue.pop(0)
+        step = queue.popleft()
         for dep_name in config.get_step_dependencies(step):
             if dep_name not in needed_steps:
                 needed_steps.add(dep_name)
-                queue.append(step_by_name[dep_name])
+                queue.append(config.get_step_by_name(dep_name))
 
     # Return in pipeline definition order
     return [s for s in config.steps if s.name in needed_steps]
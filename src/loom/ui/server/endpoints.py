@@ -1,5 +1,10 @@
 """HTTP API endpoints for the pipeline editor server."""
 
+import asyncio
+import copy
+import functools
+import hashlib
+import json
 import os
 import signal
 import subprocess
@@ -7,10 +12,12 @@ import sys
 from pathlib import Path
 from typing import Any
 
-from fastapi import APIRouter, HTTPException, Query, Response
+import yaml
+from fastapi import APIRouter, HTTPException, Query, Request, Response
 from fastapi.responses import FileResponse, HTMLResponse
 from ruamel.yaml import YAML
 from send2trash import send2trash  # type: ignore[import-untyped]
+from send2trash.exceptions import TrashPermissionError  # type: ignore[import-untyped]
 
 from loom.runner.url import check_url_exists, download_url, is_url
 
@@ -23,12 +30,74 @@ from .validation import validate_pipeline
 _yaml = YAML()
 _yaml.preserve_quotes = True
 
+# Safe loader for the graph the editor saves back; YAML 1.2 like the round-trip one
+_graph_yaml = YAML(typ="safe")
+
+# libyaml-backed loader for validation (falls back to pure Python if unavailable)
+_SafeLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 # Create router for API endpoints
 router = APIRouter()
 
 # Frontend directory path
 FRONTEND_DIR = Path(__file__).parent.parent / "frontend" / "dist"
 
+# In-flight trash operations by path, so repeated requests share a single call
+_pending_trash: dict[Path, asyncio.Future[None]] = {}
+
+
+@functools.lru_cache(maxsize=8)
+def _parse_config_bytes(content: bytes, graph: bool = False) -> Any:
+    """Parse pipeline YAML bytes, memoized on the exact content.
+
+    The editor reloads the same file for every graph and validation request;
+    keying on content means an edit is always re-parsed while unchanged files
+    skip the parse. ``graph`` selects ruamel's safe loader instead of PyYAML's.
+    Callers must not mutate the returned object.
+    """
+    if graph:
+        return _graph_yaml.load(content)
+    return yaml.load(content, Loader=_SafeLoader)
+
+
+def _load_config_data(config_path: Path) -> dict[str, Any]:
+    """Parse a pipeline YAML file for validation.
+
+    Uses PyYAML's C loader, which is much faster than the round-trip loader and
+    parses values the same way the runner does. Nothing parsed here is written
+    back to the file.
+    """
+    data: dict[str, Any] = copy.deepcopy(_parse_config_bytes(config_path.read_bytes())) or {}
+    return data
+
+
+def _load_graph_data(config_path: Path) -> dict[str, Any]:
+    """Parse a pipeline YAML file for the editor graph.
+
+    The graph is merged back into the round-trip parse by save_config, so its
+    values must follow the same YAML 1.2 rules: PyYAML's YAML 1.1 would turn
+    scalars like ``yes`` or ``off`` into booleans and rewrite them on save.
+    """
+    content = config_path.read_bytes()
+    data: dict[str, Any] = copy.deepcopy(_parse_config_bytes(content, graph=True)) or {}
+    return data
+
+
+async def _trash_path(path: Path) -> None:
+    """Move a path to trash in a worker thread.
+
+    send2trash can take hundreds of milliseconds (D-Bus on Linux, Finder on
+    macOS), so it runs off the event loop. Concurrent requests for the same
+    path await the one operation already in flight.
+    """
+    pending = _pending_trash.get(path)
+    if pending is None:
+        pending = asyncio.ensure_future(asyncio.to_thread(send2trash, os.fspath(path)))
+        _pending_trash[path] = pending
+        pending.add_done_callback(lambda _: _pending_trash.pop(path, None))
+    # Shield so one client disconnecting doesn't cancel the shared operation
+    await asyncio.shield(pending)
+
 
 @router.get("/api/config/validate")
 def validate_config(path: str = Query(None)) -> ValidationResult:
@@ -39,14 +108,13 @@ def validate_config(path: str = Query(None)) -> ValidationResult:
     if not config_path or not config_path.exists():
         return ValidationResult(warnings=[])
 
-    with open(config_path) as f:
-        data = _yaml.load(f) or {}
+    data = _load_config_data(config_path)
 
     # Build task schema lookup
     schemas = list_task_schemas(state.tasks_dir)
     task_schemas = {schema.path: schema.to_dict() for schema in schemas}
 
-    warnings = validate_pipeline(dict(data), task_schemas)
+    warnings = validate_pipeline(data, task_schemas)
     return ValidationResult(warnings=warnings)
 
 
@@ -61,10 +129,7 @@ def get_config(path: str = Query(None)) -> PipelineGraph:
     if not config_path.exists():
         raise HTTPException(404, f"Config not found: {config_path}")
 
-    with open(config_path) as f:
-        data = _yaml.load(f) or {}
-
-    return yaml_to_graph(dict(data))
+    return yaml_to_graph(_load_graph_data(config_path))
 
 
 @router.post("/api/config")
@@ -261,6 +326,21 @@ def get_steps_freshness() -> dict[str, dict[str, dict[str, str]]]:
 
     freshness: dict[str, dict[str, str]] = {}
 
+    # Resolved path and mtime (None if missing) per reference, taken once per
+    # request: a step's outputs are usually the next step's inputs
+    snapshot: dict[str, tuple[Path, float | None]] = {}
+
+    def stat_ref(var_ref: str) -> tuple[Path, float | None]:
+        entry = snapshot.get(var_ref)
+        if entry is None:
+            path = config.resolve_path(var_ref)
+            try:
+                mtime: float | None = path.stat().st_mtime
+            except OSError:
+                mtime = None
+            entry = snapshot[var_ref] = (path, mtime)
+        return entry
+
     for step in config.steps:
         step_name = step.name
 
@@ -276,11 +356,11 @@ def get_steps_freshness() -> dict[str, dict[str, dict[str, str]]]:
 
         for var_ref in step.outputs.values():
             try:
-                output_path = config.resolve_path(var_ref)
+                output_path, output_mtime = stat_ref(var_ref)
                 output_paths.append(output_path)
 
-                if output_path.exists():
-                    output_mtimes.append(output_path.stat().st_mtime)
+                if output_mtime is not None:
+                    output_mtimes.append(output_mtime)
                 else:
                     missing_outputs.append(str(output_path))
             except Exception:
@@ -301,10 +381,9 @@ def get_steps_freshness() -> dict[str, dict[str, dict[str, str]]]:
 
         for var_ref in step.inputs.values():
             try:
-                input_path = config.resolve_path(var_ref)
+                input_path, mtime = stat_ref(var_ref)
 
-                if input_path.exists():
-                    mtime = input_path.stat().st_mtime
+                if mtime is not None:
                     input_mtimes.append(mtime)
                     if newest_input is None or mtime > newest_input:
                         newest_input = mtime
@@ -452,7 +531,7 @@ def get_preview_by_path(
 
 
 @router.delete("/api/data/{name}")
-def trash_data(
+async def trash_data(
     name: str, force: bool = Query(False, description="Force deletion of source data")
 ) -> dict[str, str]:
     """Move data node data to trash.
@@ -469,7 +548,7 @@ def trash_data(
         raise HTTPException(status_code=400, detail="No config loaded")
 
     try:
-        config = PipelineConfig.from_yaml(state.config_path)
+        config = await asyncio.to_thread(PipelineConfig.from_yaml, state.config_path)
     except Exception as e:
         raise HTTPException(status_code=400, detail=f"Failed to load config: {e}")
 
@@ -498,10 +577,12 @@ def trash_data(
         raise HTTPException(status_code=404, detail=f"Path does not exist: {path}")
 
     try:
-        send2trash(str(path))
-        return {"status": "ok", "message": f"Moved to trash: {path}"}
+        await _trash_path(path)
+    except TrashPermissionError as e:
+        raise HTTPException(status_code=403, detail=f"Failed to trash: {e}")
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to trash: {e}")
+    return {"status": "ok", "message": f"Moved to trash: {path}"}
 
 
 @router.get("/api/clean/preview")
@@ -611,11 +692,11 @@ def open_path(path: str = Query(...)) -> dict[str, str]:
 
     try:
         if sys.platform == "darwin":
-            subprocess.run(["open", str(resolved_path)], check=True)
+            subprocess.run(["open", os.fspath(resolved_path)], check=True)
         elif sys.platform == "win32":
-            os.startfile(str(resolved_path))  # type: ignore[attr-defined]
+            os.startfile(os.fspath(resolved_path))  # type: ignore[attr-defined]
         else:  # Linux
-            subprocess.run(["xdg-open", str(resolved_path)], check=True)
+            subprocess.run(["xdg-open", os.fspath(resolved_path)], check=True)
         return {"status": "ok"}
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to open: {e}")
@@ -738,22 +819,30 @@ def get_preview(data_key: str) -> dict[str, Any]:
     return dict(preview)
 
 
-@router.get("/api/run/status")
-def get_run_status() -> ExecutionStatus:
+@functools.lru_cache(maxsize=16)
+def _status_json(status: str, current_step: str | None) -> bytes:
+    """Serialize an execution status once; the UI polls far more often than it changes."""
+    return json.dumps({"status": status, "current_step": current_step}).encode()
+
+
+@router.get("/api/run/status", response_model=ExecutionStatus)
+async def get_run_status() -> Response:
     """Get current execution status."""
-    return ExecutionStatus(
-        status=state.execution_state["status"],
-        current_step=state.execution_state["current_step"],
-    )
+    # Runs on the event loop, like the terminal handlers that update the state,
+    # so both fields are read without an update landing in between
+    current = state.execution_state
+    body = _status_json(current.status, current.current_step)
+    return Response(content=body, media_type="application/json")
 
 
 @router.post("/api/run/cancel")
 def cancel_run() -> dict[str, str]:
     """Cancel running execution."""
-    if state.execution_state["pid"] and state.execution_state["status"] == "running":
+    current = state.execution_state
+    if current.pid and current.status == "running":
         try:
-            os.killpg(os.getpgid(state.execution_state["pid"]), signal.SIGTERM)
-            state.execution_state["status"] = "cancelled"
+            os.killpg(os.getpgid(current.pid), signal.SIGTERM)
+            current.status = "cancelled"
             return {"status": "cancelled"}
         except ProcessLookupError:
             return {"status": "not_found"}
@@ -763,14 +852,8 @@ def cancel_run() -> dict[str, str]:
 # Frontend serving endpoints
 
 
-@router.get("/")
-def serve_index() -> HTMLResponse:
-    """Serve the frontend."""
-    index_path = FRONTEND_DIR / "index.html"
-    if index_path.exists():
-        return HTMLResponse(content=index_path.read_text())
-    return HTMLResponse(
-        content="""
+# Shown when the frontend has not been built yet
+_SETUP_REQUIRED_HTML = b"""
 <!DOCTYPE html>
 <html>
 <head>
@@ -807,7 +890,48 @@ npm run build</code></pre>
 </body>
 </html>
         """
-    )
+
+# Cached index page as (mtime_ns, size, body, etag); re-read only when the file changes
+_index_cache: tuple[int, int, bytes, str] | None = None
+
+
+def _etag(body: bytes) -> str:
+    """Build a strong ETag for a response body."""
+    return f'"{hashlib.blake2b(body, digest_size=8).hexdigest()}"'
+
+
+_SETUP_REQUIRED_ETAG = _etag(_SETUP_REQUIRED_HTML)
+
+
+def _load_index() -> tuple[bytes, str]:
+    """Return the frontend index page and its ETag.
+
+    The built index.html is cached in memory and only re-read when its mtime or
+    size changes, so rebuilding the frontend is picked up without a restart.
+    """
+    global _index_cache
+    index_path = FRONTEND_DIR / "index.html"
+    try:
+        st = index_path.stat()
+    except OSError:
+        return _SETUP_REQUIRED_HTML, _SETUP_REQUIRED_ETAG
+
+    if _index_cache is None or _index_cache[:2] != (st.st_mtime_ns, st.st_size):
+        body = index_path.read_bytes()
+        _index_cache = (st.st_mtime_ns, st.st_size, body, _etag(body))
+    return _index_cache[2], _index_cache[3]
+
+
+@router.get("/", response_class=HTMLResponse)
+def serve_index(request: Request) -> Response:
+    """Serve the frontend."""
+    body, etag = _load_index()
+    # Clients revalidate on every load and get a bodiless 304 while unchanged
+    headers = {"ETag": etag, "Cache-Control": "no-cache"}
+    if_none_match = request.headers.get("if-none-match", "")
+    if etag in (tag.strip() for tag in if_none_match.split(",")):
+        return Response(status_code=304, headers=headers)
+    return Response(content=body, media_type="text/html", headers=headers)
 
 
 @router.get("/favicon.svg")
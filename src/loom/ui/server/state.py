@@ -1,5 +1,6 @@
 """Global state management for the pipeline editor server."""
 
+from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
 
@@ -12,13 +13,18 @@ workspace_dir: Path | None = None  # Set when launched in workspace mode
 # Each step has its own entry: {"pid": int, "master_fd": int, "status": str}
 running_steps: dict[str, dict[str, Any]] = {}
 
-# Legacy single execution state (for backward compatibility with sequential modes)
-execution_state: dict[str, Any] = {
-    "status": "idle",  # idle, running, cancelled, completed, failed
-    "current_step": None,
-    "pid": None,
-    "master_fd": None,
-}
+
+@dataclass(slots=True)
+class ExecutionState:
+    """Legacy single execution state (for backward compatibility with sequential modes)."""
+
+    status: str = "idle"  # idle, running, cancelled, completed, failed
+    current_step: str | None = None
+    pid: int | None = None
+    master_fd: int | None = None
+
+
+execution_state = ExecutionState()
 
 
 def configure(
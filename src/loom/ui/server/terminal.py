@@ -3,9 +3,12 @@
 import asyncio
 import fcntl
 import json
+import logging
 import os
 import pty
+import shlex
 import signal
+import subprocess
 from typing import Any
 
 from fastapi import WebSocket, WebSocketDisconnect
@@ -13,6 +16,154 @@ from fastapi import WebSocket, WebSocketDisconnect
 from . import state
 from .models import RunRequest
 
+logger = logging.getLogger(__name__)
+
+# Upper bound on steps started at once when the user runs a selection in parallel
+_MAX_PARALLEL_STEPS = min(os.cpu_count() or 4, 8)
+
+# Status line tags written into the terminal stream
+_RUNNING = b"\x1b[36m[RUNNING]\x1b[0m "
+_SUCCESS = b"\x1b[32m[SUCCESS]\x1b[0m "
+_FAILED = b"\x1b[31m[FAILED]\x1b[0m "
+_CANCELLED = b"\x1b[33m[CANCELLED]\x1b[0m "
+
+# Bytes requested per PTY read
+_READ_SIZE = 65536
+
+# How long a streaming loop sleeps without PTY output before re-checking the
+# process and cancel state, and how fast it polls for exit once the PTY hangs up
+_IDLE_POLL_INTERVAL = 0.1
+_EXIT_POLL_INTERVAL = 0.01
+
+
+def _spawn_in_pty(cmd: list[str]) -> tuple[subprocess.Popen[bytes], int]:
+    """Start a command in its own session with a PTY as stdin/stdout/stderr.
+
+    Uses subprocess rather than a bare os.fork(), so the child is started via
+    vfork/posix_spawn and the server's heap is not copied for every step.
+
+    Args:
+        cmd: Command to execute.
+
+    Returns:
+        Tuple of (process, master_fd). The master fd is non-blocking and owned
+        by the caller.
+    """
+    master_fd, slave_fd = pty.openpty()
+    try:
+        proc = subprocess.Popen(
+            cmd,
+            stdin=slave_fd,
+            stdout=slave_fd,
+            stderr=slave_fd,
+            start_new_session=True,
+        )
+    except BaseException:
+        os.close(master_fd)
+        raise
+    finally:
+        os.close(slave_fd)
+
+    flags = fcntl.fcntl(master_fd, fcntl.F_GETFL)
+    fcntl.fcntl(master_fd, fcntl.F_SETFL, flags | os.O_NONBLOCK)
+    return proc, master_fd
+
+
+def _status_line(tag: bytes, step_name: str, detail: str = "") -> bytes:
+    """Build a terminal status line such as ``[SUCCESS] step_name``."""
+    return tag + f"{step_name}{detail}\r\n".encode()
+
+
+def _drain_pty(master_fd: int, buf: bytearray, scratch: memoryview) -> bool:
+    """Append everything currently readable from a PTY master to a buffer.
+
+    Lets the streaming loops send one WebSocket frame per poll tick instead of
+    one per read. Reads go into a reused scratch buffer, so draining a chatty
+    child doesn't allocate a new bytes object per read.
+
+    Args:
+        master_fd: Non-blocking PTY master file descriptor.
+        buf: Buffer to append output to.
+        scratch: Writable buffer to read into.
+
+    Returns:
+        False once the PTY is closed (EOF, or EIO after the child side exits),
+        True if more output may follow.
+    """
+    while True:
+        try:
+            n = os.readv(master_fd, [scratch])
+        except BlockingIOError:
+            return True
+        except OSError:
+            return False
+        if not n:
+            return False
+        buf += scratch[:n]
+
+
+class _PtyStream:
+    """Readiness-driven reader that owns a non-blocking PTY master.
+
+    Registers the fd with the event loop, so streaming loops wake as soon as
+    the child writes instead of polling on a fixed interval. The stream is the
+    only place the fd gets closed, so a reused fd number is never closed twice.
+    """
+
+    def __init__(self, master_fd: int) -> None:
+        self.master_fd = master_fd
+        self.open = True
+        self._fd_closed = False
+        self._scratch = memoryview(bytearray(_READ_SIZE))
+        self._loop = asyncio.get_running_loop()
+        self._ready = asyncio.Event()
+        self._loop.add_reader(master_fd, self._ready.set)
+
+    def drain(self, buf: bytearray, final: bool = False) -> None:
+        """Append all currently readable output to buf.
+
+        Skips reading after a wakeup without readiness, so quiet steps don't
+        pay for a failing non-blocking read on every idle tick.
+
+        Args:
+            buf: Buffer to append output to.
+            final: Read even without readiness, to collect the tail of output
+                once the process has exited.
+        """
+        if not self.open or not (final or self._ready.is_set()):
+            return
+        self._ready.clear()
+        if not _drain_pty(self.master_fd, buf, self._scratch):
+            self._unwatch()
+
+    async def wait(self) -> None:
+        """Wait until the PTY has output or the poll interval elapses."""
+        if not self.open:
+            await asyncio.sleep(_EXIT_POLL_INTERVAL)
+            return
+        try:
+            async with asyncio.timeout(_IDLE_POLL_INTERVAL):
+                await self._ready.wait()
+        except TimeoutError:
+            pass
+
+    def close(self) -> None:
+        """Stop watching and close the fd. Safe to call more than once."""
+        self._unwatch()
+        if not self._fd_closed:
+            self._fd_closed = True
+            os.close(self.master_fd)
+
+    def _unwatch(self) -> None:
+        """Stop watching the fd.
+
+        A hung-up PTY stays readable forever, so this runs as soon as the
+        stream hits EOF to keep the event loop from spinning on it.
+        """
+        if self.open:
+            self.open = False
+            self._loop.remove_reader(self.master_fd)
+
 
 async def terminal_websocket(websocket: WebSocket) -> None:
     """WebSocket endpoint for real-time terminal streaming.
@@ -25,7 +176,6 @@ async def terminal_websocket(websocket: WebSocket) -> None:
     """
     await websocket.accept()
 
-    master_fd = None
     pid = None
 
     try:
@@ -122,24 +272,17 @@ async def terminal_websocket(websocket: WebSocket) -> None:
             except (ProcessLookupError, PermissionError):
                 pass
     except Exception as e:
-        import traceback
-
-        traceback.print_exc()  # Print to server console for debugging
+        logger.exception("Terminal websocket failed")
         try:
             await websocket.send_text(f"\x1b[31m[ERROR]\x1b[0m {e}\r\n")
         except Exception:
             pass  # WebSocket might already be closed
-        state.execution_state["status"] = "failed"
+        state.execution_state.status = "failed"
     finally:
-        if master_fd is not None:
-            try:
-                os.close(master_fd)
-            except OSError:
-                pass
-        state.execution_state["status"] = "idle"
-        state.execution_state["current_step"] = None
-        state.execution_state["pid"] = None
-        state.execution_state["master_fd"] = None
+        state.execution_state.status = "idle"
+        state.execution_state.current_step = None
+        state.execution_state.pid = None
+        state.execution_state.master_fd = None
 
 
 async def _run_single_step(
@@ -176,134 +319,108 @@ async def _run_single_step(
         json.dumps({"type": "step_status", "step": step_name, "status": "running"})
     )
 
-    cmd_str = " ".join(cmd)
-    await websocket.send_text(f"\x1b[36m[RUNNING]\x1b[0m {step_name}\r\n")
-    await websocket.send_text(f"  {cmd_str}\r\n")
-
-    # Create PTY
-    step_master_fd, step_slave_fd = pty.openpty()
-
-    # Fork and exec
-    step_pid = os.fork()
-    if step_pid == 0:
-        # Child process
-        os.setsid()
-        os.dup2(step_slave_fd, 0)
-        os.dup2(step_slave_fd, 1)
-        os.dup2(step_slave_fd, 2)
-        os.close(step_master_fd)
-        os.close(step_slave_fd)
-        os.execvp(cmd[0], cmd)
-    else:
-        # Parent process
-        os.close(step_slave_fd)
-
-        # Register this step as running
-        state.register_running_step(step_name, step_pid, step_master_fd)
+    cmd_str = shlex.join(cmd)
+    await websocket.send_bytes(_status_line(_RUNNING, step_name, f"\r\n  {cmd_str}"))
 
-        # Set non-blocking
-        flags = fcntl.fcntl(step_master_fd, fcntl.F_GETFL)
-        fcntl.fcntl(step_master_fd, fcntl.F_SETFL, flags | os.O_NONBLOCK)
+    # Start the step attached to a fresh PTY
+    step_proc, step_master_fd = _spawn_in_pty(cmd)
+    step_pid = step_proc.pid
+    stream = _PtyStream(step_master_fd)
 
-        cancelled = False
-        ws_closed = False
+    # Register this step as running
+    state.register_running_step(step_name, step_pid, step_master_fd)
 
-        async def listen_for_cancel_step() -> None:
-            nonlocal cancelled, ws_closed
-            try:
-                while True:
-                    msg = await websocket.receive_text()
-                    if msg == "__CANCEL__":
-                        cancelled = True
-                        try:
-                            os.killpg(os.getpgid(step_pid), signal.SIGTERM)
-                        except (ProcessLookupError, PermissionError):
-                            pass
-                        break
-            except Exception:
-                # WebSocket closed by client
-                ws_closed = True
+    cancelled = False
+    ws_closed = False
 
-        cancel_task = asyncio.create_task(listen_for_cancel_step())
+    async def listen_for_cancel_step() -> None:
+        nonlocal cancelled, ws_closed
+        try:
+            while True:
+                msg = await websocket.receive_text()
+                if msg == "__CANCEL__":
+                    cancelled = True
+                    try:
+                        os.killpg(os.getpgid(step_pid), signal.SIGTERM)
+                    except (ProcessLookupError, PermissionError):
+                        pass
+                    break
+        except Exception:
+            # WebSocket closed by client
+            ws_closed = True
 
-        async def safe_send_bytes(data: bytes) -> bool:
-            """Send bytes, return False if websocket is closed."""
-            if ws_closed:
-                return False
-            try:
-                await websocket.send_bytes(data)
-                return True
-            except Exception:
-                return False
+    cancel_task = asyncio.create_task(listen_for_cancel_step())
 
-        async def safe_send_text(text: str) -> bool:
-            """Send text, return False if websocket is closed."""
-            if ws_closed:
-                return False
-            try:
-                await websocket.send_text(text)
-                return True
-            except Exception:
-                return False
+    async def safe_send_bytes(data: bytes) -> bool:
+        """Send bytes, return False if websocket is closed."""
+        if ws_closed:
+            return False
+        try:
+            await websocket.send_bytes(data)
+            return True
+        except Exception:
+            return False
 
+    async def safe_send_text(text: str) -> bool:
+        """Send text, return False if websocket is closed."""
+        if ws_closed:
+            return False
         try:
-            # Stream output
-            while True:
-                try:
-                    data_bytes = os.read(step_master_fd, 4096)
-                    if not data_bytes:
-                        break
-                    if not await safe_send_bytes(data_bytes):
-                        break  # WebSocket closed
-                except BlockingIOError:
-                    # Check if process is still running
-                    result = os.waitpid(step_pid, os.WNOHANG)
-                    if result[0] != 0:
-                        # Process exited, drain remaining output
-                        try:
-                            while True:
-                                remaining = os.read(step_master_fd, 4096)
-                                if not remaining:
-                                    break
-                                if not await safe_send_bytes(remaining):
-                                    break
-                        except (BlockingIOError, OSError):
-                            pass
-                        break
-                    await asyncio.sleep(0.01)
-                except OSError:
-                    break
+            await websocket.send_text(text)
+            return True
+        except Exception:
+            return False
 
-            # Wait for process
-            _, status = os.waitpid(step_pid, 0)
+    # Output read since the last frame; the tail is sent together with the result line
+    out_buf = bytearray()
 
-        finally:
-            cancel_task.cancel()
-            try:
-                await cancel_task
-            except asyncio.CancelledError:
-                pass
+    try:
+        # Stream output, one frame per wakeup
+        while True:
+            # Poll before draining so output written just before exit is not lost
+            exited = step_proc.poll() is not None
+            stream.drain(out_buf, final=exited)
+            if exited:
+                break
+            if out_buf:
+                if not await safe_send_bytes(bytes(out_buf)):
+                    break  # WebSocket closed
+                out_buf.clear()
+            await stream.wait()
+
+        # Wait for process (off the event loop, it may still be running)
+        returncode = await asyncio.to_thread(step_proc.wait)
 
-            os.close(step_master_fd)
-            state.unregister_running_step(step_name)
+    finally:
+        cancel_task.cancel()
+        try:
+            await cancel_task
+        except asyncio.CancelledError:
+            pass
 
-        # Send result (only if websocket still open)
-        if cancelled:
-            await safe_send_text(f"\x1b[33m[CANCELLED]\x1b[0m {step_name}\r\n")
-            await safe_send_text(
-                json.dumps({"type": "step_status", "step": step_name, "status": "cancelled"})
-            )
-        elif os.WIFEXITED(status) and os.WEXITSTATUS(status) == 0:
-            await safe_send_text(f"\x1b[32m[SUCCESS]\x1b[0m {step_name}\r\n")
-            await safe_send_text(
-                json.dumps({"type": "step_status", "step": step_name, "status": "completed"})
-            )
-        else:
-            exit_code = os.WEXITSTATUS(status) if os.WIFEXITED(status) else -1
-            await safe_send_text(f"\x1b[31m[FAILED]\x1b[0m {step_name} (exit code {exit_code})\r\n")
-            await safe_send_text(
-                json.dumps({"type": "step_status", "step": step_name, "status": "failed"})
-            )
+        stream.close()
+        state.unregister_running_step(step_name)
+
+    # Send result (only if websocket still open)
+    if cancelled:
+        out_buf += _status_line(_CANCELLED, step_name)
+        await safe_send_bytes(bytes(out_buf))
+        await safe_send_text(
+            json.dumps({"type": "step_status", "step": step_name, "status": "cancelled"})
+        )
+    elif returncode == 0:
+        out_buf += _status_line(_SUCCESS, step_name)
+        await safe_send_bytes(bytes(out_buf))
+        await safe_send_text(
+            json.dumps({"type": "step_status", "step": step_name, "status": "completed"})
+        )
+    else:
+        exit_code = returncode if returncode >= 0 else -1
+        out_buf += _status_line(_FAILED, step_name, f" (exit code {exit_code})")
+        await safe_send_bytes(bytes(out_buf))
+        await safe_send_text(
+            json.dumps({"type": "step_status", "step": step_name, "status": "failed"})
+        )
 
 
 async def _run_parallel_steps(
@@ -329,7 +446,7 @@ async def _run_parallel_steps(
         await websocket.send_text("\x1b[33m[WARN]\x1b[0m No steps to run\r\n")
         return
 
-    state.execution_state["status"] = "running"
+    state.execution_state.status = "running"
 
     # Track cancellation per step
     cancelled_steps: set[str] = set()
@@ -351,6 +468,8 @@ async def _run_parallel_steps(
 
     async def run_step_pty(step_name: str, cmd: list[str]) -> tuple[str, bool]:
         """Run a single step in its own PTY. Returns (step_name, success)."""
+        prefix = f"[OUTPUT:{step_name}]".encode()
+
         # Create output directories
         try:
             for dir_path in get_step_output_dirs(state.config_path, step_name):
@@ -366,142 +485,125 @@ async def _run_parallel_steps(
             json.dumps({"type": "step_status", "step": step_name, "status": "running"})
         )
 
-        cmd_str = " ".join(cmd)
-        await websocket.send_bytes(
-            f"[OUTPUT:{step_name}]\x1b[36m[RUNNING]\x1b[0m {step_name}\r\n  {cmd_str}\r\n".encode()
-        )
-
-        # Create PTY
-        step_master_fd, step_slave_fd = pty.openpty()
-
-        step_pid = os.fork()
-        if step_pid == 0:
-            # Child process
-            os.setsid()
-            os.dup2(step_slave_fd, 0)
-            os.dup2(step_slave_fd, 1)
-            os.dup2(step_slave_fd, 2)
-            os.close(step_master_fd)
-            os.close(step_slave_fd)
-            os.execvp(cmd[0], cmd)
-        else:
-            # Parent process
-            os.close(step_slave_fd)
-
-            # Set non-blocking
-            flags = fcntl.fcntl(step_master_fd, fcntl.F_GETFL)
-            fcntl.fcntl(step_master_fd, fcntl.F_SETFL, flags | os.O_NONBLOCK)
+        cmd_str = shlex.join(cmd)
+        await websocket.send_bytes(prefix + _status_line(_RUNNING, step_name, f"\r\n  {cmd_str}"))
 
-            try:
-                while True:
-                    # Check if cancelled
-                    if step_name in cancelled_steps:
-                        try:
-                            os.killpg(os.getpgid(step_pid), signal.SIGTERM)
-                        except (ProcessLookupError, PermissionError):
-                            pass
-                        break
+        # Start the step attached to a fresh PTY
+        step_proc, step_master_fd = _spawn_in_pty(cmd)
+        step_pid = step_proc.pid
 
-                    # Check if process exited
-                    wpid, status = os.waitpid(step_pid, os.WNOHANG)
-                    if wpid != 0:
-                        # Read remaining output
-                        try:
-                            while True:
-                                data_bytes = os.read(step_master_fd, 4096)
-                                if not data_bytes:
-                                    break
-                                await websocket.send_bytes(
-                                    f"[OUTPUT:{step_name}]".encode() + data_bytes
-                                )
-                        except (OSError, BlockingIOError):
-                            pass
+        # Output is batched per wakeup into one multiplexed frame
+        out_buf = bytearray()
+        stream = _PtyStream(step_master_fd)
 
-                        os.close(step_master_fd)
+        try:
+            while True:
+                # Check if cancelled
+                if step_name in cancelled_steps:
+                    try:
+                        os.killpg(os.getpgid(step_pid), signal.SIGTERM)
+                    except (ProcessLookupError, PermissionError):
+                        pass
+                    break
 
-                        if os.WIFEXITED(status) and os.WEXITSTATUS(status) == 0:
-                            await websocket.send_bytes(
-                                f"[OUTPUT:{step_name}]\x1b[32m[SUCCESS]\x1b[0m {step_name}\r\n".encode()
-                            )
-                            await websocket.send_text(
-                                json.dumps(
-                                    {
-                                        "type": "step_status",
-                                        "step": step_name,
-                                        "status": "completed",
-                                    }
-                                )
+                # Check if process exited, then drain so no trailing output is lost
+                returncode = step_proc.poll()
+                stream.drain(out_buf, final=returncode is not None)
+                if returncode is not None:
+                    if returncode == 0:
+                        out_buf += _status_line(_SUCCESS, step_name)
+                        await websocket.send_bytes(prefix + out_buf)
+                        await websocket.send_text(
+                            json.dumps(
+                                {
+                                    "type": "step_status",
+                                    "step": step_name,
+                                    "status": "completed",
+                                }
                             )
-                            return step_name, True
-                        else:
-                            exit_code = os.WEXITSTATUS(status) if os.WIFEXITED(status) else -1
-                            await websocket.send_bytes(
-                                f"[OUTPUT:{step_name}]\x1b[31m[FAILED]\x1b[0m {step_name} (exit code {exit_code})\r\n".encode()
-                            )
-                            await websocket.send_text(
-                                json.dumps(
-                                    {
-                                        "type": "step_status",
-                                        "step": step_name,
-                                        "status": "failed",
-                                    }
-                                )
+                        )
+                        return step_name, True
+                    else:
+                        exit_code = returncode if returncode >= 0 else -1
+                        out_buf += _status_line(_FAILED, step_name, f" (exit code {exit_code})")
+                        await websocket.send_bytes(prefix + out_buf)
+                        await websocket.send_text(
+                            json.dumps(
+                                {
+                                    "type": "step_status",
+                                    "step": step_name,
+                                    "status": "failed",
+                                }
                             )
-                            return step_name, False
+                        )
+                        return step_name, False
 
-                    # Read output
-                    try:
-                        data_bytes = os.read(step_master_fd, 4096)
-                        if data_bytes:
-                            await websocket.send_bytes(
-                                f"[OUTPUT:{step_name}]".encode() + data_bytes
-                            )
-                    except BlockingIOError:
-                        pass
-                    except OSError:
-                        break
+                if out_buf:
+                    await websocket.send_bytes(prefix + out_buf)
+                    out_buf.clear()
 
-                    await asyncio.sleep(0.01)
-            finally:
-                try:
-                    os.close(step_master_fd)
-                except OSError:
-                    pass
+                await stream.wait()
+        except asyncio.CancelledError:
+            # A sibling step raised; don't leave this one running unattended
+            try:
+                os.killpg(os.getpgid(step_pid), signal.SIGTERM)
+            except (ProcessLookupError, PermissionError):
+                pass
+            raise
+        finally:
+            stream.close()
+
+        # Handle cancellation
+        if step_name in cancelled_steps:
+            await websocket.send_bytes(prefix + _status_line(_CANCELLED, step_name))
+            await websocket.send_text(
+                json.dumps({"type": "step_status", "step": step_name, "status": "cancelled"})
+            )
+            return step_name, False
+
+        return step_name, False
 
-            # Handle cancellation
+    semaphore = asyncio.Semaphore(_MAX_PARALLEL_STEPS)
+
+    async def run_step_bounded(step_name: str, cmd: list[str]) -> tuple[str, bool]:
+        """Run a step once a slot is free, unless it was cancelled while queued."""
+        async with semaphore:
             if step_name in cancelled_steps:
                 await websocket.send_bytes(
-                    f"[OUTPUT:{step_name}]\x1b[33m[CANCELLED]\x1b[0m {step_name}\r\n".encode()
+                    f"[OUTPUT:{step_name}]".encode() + _status_line(_CANCELLED, step_name)
                 )
                 await websocket.send_text(
                     json.dumps({"type": "step_status", "step": step_name, "status": "cancelled"})
                 )
                 return step_name, False
-
-        return step_name, False
+            return await run_step_pty(step_name, cmd)
 
     # Start cancel listener
     cancel_task = asyncio.create_task(listen_for_cancel_parallel())
 
     try:
-        # Run all steps in parallel
-        tasks = [run_step_pty(name, cmd) for name, cmd in commands]
-        results = await asyncio.gather(*tasks, return_exceptions=True)
+        # Run steps in parallel, at most _MAX_PARALLEL_STEPS at a time
+        try:
+            async with asyncio.TaskGroup() as tg:
+                tasks = [tg.create_task(run_step_bounded(name, cmd)) for name, cmd in commands]
+        except* WebSocketDisconnect as group:
+            # Hand the handler a plain disconnect, not the TaskGroup's ExceptionGroup
+            raise group.exceptions[0] from None
 
         # Check results
-        success_count = sum(1 for r in results if isinstance(r, tuple) and r[1])
+        success_count = sum(1 for task in tasks if task.result()[1])
         total = len(commands)
 
         if success_count == total:
             await websocket.send_text(
                 f"\x1b[32m[COMPLETED]\x1b[0m {total} step(s) succeeded in parallel\r\n"
             )
-            state.execution_state["status"] = "completed"
+            state.execution_state.status = "completed"
         else:
             await websocket.send_text(
                 f"\x1b[33m[PARTIAL]\x1b[0m {success_count}/{total} steps succeeded\r\n"
             )
-            state.execution_state["status"] = "failed" if success_count == 0 else "completed"
+            state.execution_state.status = "failed" if success_count == 0 else "completed"
     finally:
         cancel_task.cancel()
         try:
@@ -588,10 +690,10 @@ async def _run_sequential_commands(
         await websocket.send_text("\x1b[33m[WARN]\x1b[0m No steps to run\r\n")
         return
 
-    state.execution_state["status"] = "running"
+    state.execution_state.status = "running"
 
     for step_name, cmd in commands:
-        state.execution_state["current_step"] = step_name
+        state.execution_state.current_step = step_name
 
         # Create output directories
         try:
@@ -601,7 +703,7 @@ async def _run_sequential_commands(
             await websocket.send_text(
                 f"\x1b[31m[ERROR]\x1b[0m Failed to create output dirs: {e}\r\n"
             )
-            state.execution_state["status"] = "failed"
+            state.execution_state.status = "failed"
             return
 
         # Send step status
@@ -609,129 +711,107 @@ async def _run_sequential_commands(
             json.dumps({"type": "step_status", "step": step_name, "status": "running"})
         )
 
-        cmd_str = " ".join(cmd)
-        await websocket.send_text(f"\x1b[36m[RUNNING]\x1b[0m {step_name}\r\n")
-        await websocket.send_text(f"  {cmd_str}\r\n")
-
-        # Create PTY
-        master_fd, slave_fd = pty.openpty()
-        state.execution_state["master_fd"] = master_fd
-
-        pid = os.fork()
-        if pid == 0:
-            os.setsid()
-            os.dup2(slave_fd, 0)
-            os.dup2(slave_fd, 1)
-            os.dup2(slave_fd, 2)
-            os.close(master_fd)
-            os.close(slave_fd)
-            os.execvp(cmd[0], cmd)
-        else:
-            os.close(slave_fd)
-            state.execution_state["pid"] = pid
-
-            flags = fcntl.fcntl(master_fd, fcntl.F_GETFL)
-            fcntl.fcntl(master_fd, fcntl.F_SETFL, flags | os.O_NONBLOCK)
+        cmd_str = shlex.join(cmd)
+        await websocket.send_bytes(_status_line(_RUNNING, step_name, f"\r\n  {cmd_str}"))
 
-            cancelled = False
-
-            async def listen_for_cancel() -> None:
-                nonlocal cancelled
-                try:
-                    while True:
-                        msg = await websocket.receive_text()
-                        if msg == "__CANCEL__":
-                            cancelled = True
-                            state.execution_state["status"] = "cancelled"
-                            try:
-                                os.killpg(os.getpgid(pid), signal.SIGTERM)
-                            except (ProcessLookupError, PermissionError):
-                                pass
-                            return
-                except Exception:
-                    pass
+        # Start the step attached to a fresh PTY
+        proc, master_fd = _spawn_in_pty(cmd)
+        pid = proc.pid
+        stream = _PtyStream(master_fd)
+        state.execution_state.pid = pid
 
-            cancel_task = asyncio.create_task(listen_for_cancel())
+        cancelled = False
 
+        async def listen_for_cancel() -> None:
+            nonlocal cancelled
             try:
                 while True:
-                    if cancelled:
-                        break
-
-                    wpid, wait_status = os.waitpid(pid, os.WNOHANG)
-                    if wpid != 0:
+                    msg = await websocket.receive_text()
+                    if msg == "__CANCEL__":
+                        cancelled = True
+                        state.execution_state.status = "cancelled"
                         try:
-                            while True:
-                                data_bytes = os.read(master_fd, 4096)
-                                if not data_bytes:
-                                    break
-                                await websocket.send_bytes(data_bytes)
-                        except (OSError, BlockingIOError):
+                            os.killpg(os.getpgid(pid), signal.SIGTERM)
+                        except (ProcessLookupError, PermissionError):
                             pass
-                        break
+                        return
+            except Exception:
+                pass
 
-                    try:
-                        data_bytes = os.read(master_fd, 4096)
-                        if data_bytes:
-                            await websocket.send_bytes(data_bytes)
-                    except BlockingIOError:
-                        pass
-                    except OSError:
-                        break
+        cancel_task = asyncio.create_task(listen_for_cancel())
 
-                    await asyncio.sleep(0.01)
-            finally:
-                cancel_task.cancel()
-                try:
-                    await cancel_task
-                except asyncio.CancelledError:
-                    pass
+        # Output read since the last frame; the tail is sent together with the result line
+        out_buf = bytearray()
 
-            os.close(master_fd)
-            state.execution_state["master_fd"] = None
-            state.execution_state["pid"] = None
+        try:
+            while True:
+                if cancelled:
+                    break
 
-            if cancelled:
-                await websocket.send_text(f"\x1b[33m[CANCELLED]\x1b[0m {step_name}\r\n")
-                await websocket.send_text(
-                    json.dumps({"type": "step_status", "step": step_name, "status": "cancelled"})
-                )
-                return
+                exited = proc.poll() is not None
+                stream.drain(out_buf, final=exited)
+                if exited:
+                    break
 
-            if os.WIFEXITED(wait_status):
-                exit_code = os.WEXITSTATUS(wait_status)
-                if exit_code == 0:
-                    await websocket.send_text(f"\x1b[32m[SUCCESS]\x1b[0m {step_name}\r\n")
-                    await websocket.send_text(
-                        json.dumps(
-                            {"type": "step_status", "step": step_name, "status": "completed"}
-                        )
-                    )
-                else:
-                    await websocket.send_text(
-                        f"\x1b[31m[FAILED]\x1b[0m {step_name} (exit code {exit_code})\r\n"
-                    )
-                    await websocket.send_text(
-                        json.dumps({"type": "step_status", "step": step_name, "status": "failed"})
-                    )
-                    state.execution_state["status"] = "failed"
-                    return
-            elif state.execution_state["status"] == "cancelled":
-                await websocket.send_text(f"\x1b[33m[CANCELLED]\x1b[0m {step_name}\r\n")
+                if out_buf:
+                    await websocket.send_bytes(bytes(out_buf))
+                    out_buf.clear()
+
+                await stream.wait()
+        finally:
+            stream.close()
+            cancel_task.cancel()
+            try:
+                await cancel_task
+            except asyncio.CancelledError:
+                pass
+
+        state.execution_state.master_fd = None
+        state.execution_state.pid = None
+
+        if cancelled:
+            out_buf += _status_line(_CANCELLED, step_name)
+            await websocket.send_bytes(bytes(out_buf))
+            await websocket.send_text(
+                json.dumps({"type": "step_status", "step": step_name, "status": "cancelled"})
+            )
+            return
+
+        returncode = await asyncio.to_thread(proc.wait)
+        if returncode >= 0:
+            exit_code = returncode
+            if exit_code == 0:
+                out_buf += _status_line(_SUCCESS, step_name)
+                await websocket.send_bytes(bytes(out_buf))
                 await websocket.send_text(
-                    json.dumps({"type": "step_status", "step": step_name, "status": "cancelled"})
+                    json.dumps({"type": "step_status", "step": step_name, "status": "completed"})
                 )
-                return
             else:
-                await websocket.send_text(f"\x1b[31m[FAILED]\x1b[0m {step_name} (signal)\r\n")
+                out_buf += _status_line(_FAILED, step_name, f" (exit code {exit_code})")
+                await websocket.send_bytes(bytes(out_buf))
                 await websocket.send_text(
                     json.dumps({"type": "step_status", "step": step_name, "status": "failed"})
                 )
-                state.execution_state["status"] = "failed"
+                state.execution_state.status = "failed"
                 return
+        elif state.execution_state.status == "cancelled":
+            out_buf += _status_line(_CANCELLED, step_name)
+            await websocket.send_bytes(bytes(out_buf))
+            await websocket.send_text(
+                json.dumps({"type": "step_status", "step": step_name, "status": "cancelled"})
+            )
+            return
+        else:
+            out_buf += _status_line(_FAILED, step_name, " (signal)")
+            await websocket.send_bytes(bytes(out_buf))
+            await websocket.send_text(
+                json.dumps({"type": "step_status", "step": step_name, "status": "failed"})
+            )
+            state.execution_state.status = "failed"
+            return
 
     await websocket.send_text(f"\x1b[32m[COMPLETED]\x1b[0m {len(commands)} step(s) succeeded\r\n")
-    state.execution_state["status"] = "completed"
+    state.execution_state.status = "completed"
 
 
 async def _run_config_parallel_pipeline_with_commands(
@@ -757,7 +837,7 @@ async def _run_config_parallel_pipeline_with_commands(
         await websocket.send_text("\x1b[33m[WARN]\x1b[0m No steps to run\r\n")
         return
 
-    state.execution_state["status"] = "running"
+    state.execution_state.status = "running"
 
     step_names_list = [name for name, _ in commands]
     orch = PipelineOrchestrator(
@@ -786,6 +866,8 @@ async def _run_config_parallel_pipeline_with_commands(
 
     async def run_step_pty(step_name: str, cmd: list[str]) -> tuple[str, bool]:
         """Run a single step in its own PTY."""
+        prefix = f"[OUTPUT:{step_name}]".encode()
+
         try:
             for dir_path in get_step_output_dirs(state.config_path, step_name):
                 dir_path.mkdir(parents=True, exist_ok=True)
@@ -802,119 +884,84 @@ async def _run_config_parallel_pipeline_with_commands(
             await websocket.send_text(
                 json.dumps({"type": "step_status", "step": step_name, "status": "running"})
             )
-            cmd_str = " ".join(cmd)
+            cmd_str = shlex.join(cmd)
             await websocket.send_bytes(
-                f"[OUTPUT:{step_name}]\x1b[36m[RUNNING]\x1b[0m {step_name}\r\n  {cmd_str}\r\n".encode()
+                prefix + _status_line(_RUNNING, step_name, f"\r\n  {cmd_str}")
             )
         except Exception:
             pass
 
-        step_master_fd, step_slave_fd = pty.openpty()
-        step_pid = os.fork()
-        if step_pid == 0:
-            os.setsid()
-            os.dup2(step_slave_fd, 0)
-            os.dup2(step_slave_fd, 1)
-            os.dup2(step_slave_fd, 2)
-            os.close(step_master_fd)
-            os.close(step_slave_fd)
-            os.execvp(cmd[0], cmd)
-        else:
-            os.close(step_slave_fd)
-            flags = fcntl.fcntl(step_master_fd, fcntl.F_GETFL)
-            fcntl.fcntl(step_master_fd, fcntl.F_SETFL, flags | os.O_NONBLOCK)
-
-            try:
-                while True:
-                    if step_name in cancelled_steps:
-                        try:
-                            os.killpg(os.getpgid(step_pid), signal.SIGTERM)
-                        except (ProcessLookupError, PermissionError):
-                            pass
-                        break
+        # Start the step attached to a fresh PTY
+        step_proc, step_master_fd = _spawn_in_pty(cmd)
+        step_pid = step_proc.pid
 
-                    wpid, wait_status = os.waitpid(step_pid, os.WNOHANG)
-                    if wpid != 0:
-                        try:
-                            while True:
-                                data_bytes = os.read(step_master_fd, 4096)
-                                if not data_bytes:
-                                    break
-                                await websocket.send_bytes(
-                                    f"[OUTPUT:{step_name}]".encode() + data_bytes
-                                )
-                        except (OSError, BlockingIOError):
-                            pass
+        # Output is batched per wakeup into one multiplexed frame
+        out_buf = bytearray()
+        stream = _PtyStream(step_master_fd)
 
-                        os.close(step_master_fd)
+        try:
+            while True:
+                if step_name in cancelled_steps:
+                    try:
+                        os.killpg(os.getpgid(step_pid), signal.SIGTERM)
+                    except (ProcessLookupError, PermissionError):
+                        pass
+                    break
 
-                        if os.WIFEXITED(wait_status) and os.WEXITSTATUS(wait_status) == 0:
-                            await websocket.send_bytes(
-                                f"[OUTPUT:{step_name}]\x1b[32m[SUCCESS]\x1b[0m {step_name}\r\n".encode()
+                returncode = step_proc.poll()
+                stream.drain(out_buf, final=returncode is not None)
+                if returncode is not None:
+                    if returncode == 0:
+                        out_buf += _status_line(_SUCCESS, step_name)
+                        await websocket.send_bytes(prefix + out_buf)
+                        await websocket.send_text(
+                            json.dumps(
+                                {
+                                    "type": "step_status",
+                                    "step": step_name,
+                                    "status": "completed",
+                                }
                             )
-                            await websocket.send_text(
-                                json.dumps(
-                                    {
-                                        "type": "step_status",
-                                        "step": step_name,
-                                        "status": "completed",
-                                    }
-                                )
-                            )
-                            return step_name, True
-                        else:
-                            exit_code = (
-                                os.WEXITSTATUS(wait_status) if os.WIFEXITED(wait_status) else -1
-                            )
-                            await websocket.send_bytes(
-                                f"[OUTPUT:{step_name}]\x1b[31m[FAILED]\x1b[0m {step_name} (exit code {exit_code})\r\n".encode()
-                            )
-                            await websocket.send_text(
-                                json.dumps(
-                                    {
-                                        "type": "step_status",
-                                        "step": step_name,
-                                        "status": "failed",
-                                    }
-                                )
+                        )
+                        return step_name, True
+                    else:
+                        exit_code = returncode if returncode >= 0 else -1
+                        out_buf += _status_line(_FAILED, step_name, f" (exit code {exit_code})")
+                        await websocket.send_bytes(prefix + out_buf)
+                        await websocket.send_text(
+                            json.dumps(
+                                {
+                                    "type": "step_status",
+                                    "step": step_name,
+                                    "status": "failed",
+                                }
                             )
-                            return step_name, False
+                        )
+                        return step_name, False
 
-                    try:
-                        data_bytes = os.read(step_master_fd, 4096)
-                        if data_bytes:
-                            await websocket.send_bytes(
-                                f"[OUTPUT:{step_name}]".encode() + data_bytes
-                            )
-                    except BlockingIOError:
-                        pass
-                    except OSError:
-                        break
+                if out_buf:
+                    await websocket.send_bytes(prefix + out_buf)
+                    out_buf.clear()
 
-                    await asyncio.sleep(0.01)
-            finally:
-                try:
-                    os.close(step_master_fd)
-                except OSError:
-                    pass
+                await stream.wait()
+        finally:
+            stream.close()
 
-            if step_name in cancelled_steps:
-                try:
-                    await websocket.send_bytes(
-                        f"[OUTPUT:{step_name}]\x1b[33m[CANCELLED]\x1b[0m {step_name}\r\n".encode()
-                    )
-                    await websocket.send_text(
-                        json.dumps(
-                            {
-                                "type": "step_status",
-                                "step": step_name,
-                                "status": "cancelled",
-                            }
-                        )
+        if step_name in cancelled_steps:
+            try:
+                await websocket.send_bytes(prefix + _status_line(_CANCELLED, step_name))
+                await websocket.send_text(
+                    json.dumps(
+                        {
+                            "type": "step_status",
+                            "step": step_name,
+                            "status": "cancelled",
+                        }
                     )
-                except Exception:
-                    pass
-                return step_name, False
+                )
+            except Exception:
+                pass
+            return step_name, False
 
         return step_name, False
 
@@ -983,12 +1030,12 @@ async def _run_config_parallel_pipeline_with_commands(
             await websocket.send_text(
                 f"\x1b[32m[COMPLETED]\x1b[0m {total} step(s) succeeded in parallel\r\n"
             )
-            state.execution_state["status"] = "completed"
+            state.execution_state.status = "completed"
         else:
             await websocket.send_text(
                 f"\x1b[33m[PARTIAL]\x1b[0m {success_count}/{total} steps succeeded\r\n"
             )
-            state.execution_state["status"] = "failed" if success_count == 0 else "completed"
+            state.execution_state.status = "failed" if success_count == 0 else "completed"
 
     finally:
         cancel_task.cancel()
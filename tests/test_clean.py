@@ -200,10 +200,12 @@ class TestCleanPipelineData:
     ) -> None:
         """Should trash all files when include_source=True."""
         with patch("loom.runner.clean.send2trash") as mock_trash:
-            clean_pipeline_data(config, permanent=False, include_source=True)
+            results = clean_pipeline_data(config, permanent=False, include_source=True)
 
-        # send2trash should have been called for both existing files
-        assert mock_trash.call_count == 2
+        # Both existing files should be trashed in one batched call
+        mock_trash.assert_called_once()
+        assert len(mock_trash.call_args.args[0]) == 2
+        assert sum(1 for r in results if r.action == "trashed") == 2
 
     def test_skips_nonexistent_files(self, config: PipelineConfig) -> None:
         """Should skip files that don't exist."""
@@ -236,6 +238,32 @@ class TestCleanPipelineData:
             assert result.error is not None
             assert "Access denied" in result.error
 
+    def test_batch_trash_failure_attributes_errors(
+        self, config: PipelineConfig, sample_pipeline_dir: Path
+    ) -> None:
+        """Should retry per path after a failed batch and report only the failing one."""
+        input_file = sample_pipeline_dir / "data" / "input.txt"
+
+        def fake_trash(paths: str | list[str]) -> None:
+            if isinstance(paths, list):
+                # Batch trashes everything but input.txt, then fails
+                for path in paths:
+                    if path != str(input_file):
+                        Path(path).unlink()
+                raise OSError("batch failed")
+            if paths == str(input_file):
+                raise PermissionError("Access denied")
+            Path(paths).unlink()
+
+        with patch("loom.runner.clean.send2trash", side_effect=fake_trash):
+            results = clean_pipeline_data(config, permanent=False, include_source=True)
+
+        failed = [r for r in results if not r.success]
+        trashed = [r for r in results if r.action == "trashed"]
+        assert len(trashed) == 1
+        assert len(failed) == 1
+        assert failed[0].error is not None and "Access denied" in failed[0].error
+
     def test_cleans_thumbnail_directory(
         self, config: PipelineConfig, sample_pipeline_dir: Path
     ) -> None:
@@ -277,6 +305,35 @@ class TestCleanPipelineData:
         thumb_results = [r for r in results if THUMBNAIL_DIR_NAME in str(r.path)]
         assert len(thumb_results) == 0
 
+    def test_uses_precomputed_paths(
+        self, config: PipelineConfig, sample_pipeline_dir: Path
+    ) -> None:
+        """Should clean exactly the given paths without resolving them again."""
+        paths = get_cleanable_paths(config)
+
+        with patch("loom.runner.clean.get_cleanable_paths") as mock_get:
+            results = clean_pipeline_data(config, permanent=True, paths=paths)
+
+        mock_get.assert_not_called()
+        assert [r.path for r in results] == [path for _, path, _ in paths]
+        assert not (sample_pipeline_dir / "data" / "output.csv").exists()
+
+    def test_deletes_symlink_not_target(
+        self, config: PipelineConfig, sample_pipeline_dir: Path
+    ) -> None:
+        """Should remove a symlinked directory itself, leaving its target intact."""
+        target = sample_pipeline_dir / "real-thumbnails"
+        target.mkdir()
+        (target / "thumb.png").write_bytes(b"fake png")
+        (sample_pipeline_dir / THUMBNAIL_DIR_NAME).symlink_to(target)
+
+        results = clean_pipeline_data(config, permanent=True)
+
+        thumb_result = next(r for r in results if THUMBNAIL_DIR_NAME in str(r.path))
+        assert thumb_result.action == "deleted"
+        assert not (sample_pipeline_dir / THUMBNAIL_DIR_NAME).is_symlink()
+        assert (target / "thumb.png").exists()
+
 
 class TestCleanResult:
     """Tests for CleanResult dataclass."""
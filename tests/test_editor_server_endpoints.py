@@ -1,9 +1,13 @@
 """Tests for editor server HTTP endpoints and validation logic."""
 
+import asyncio
+import os
+import sys
 import time
 from pathlib import Path
-from unittest.mock import patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
+from fastapi import WebSocketDisconnect
 from fastapi.testclient import TestClient
 
 from loom.ui.server import (
@@ -16,6 +20,7 @@ from loom.ui.server import (
     app,
     configure,
 )
+from loom.ui.server.terminal import terminal_websocket
 
 # =============================================================================
 # Tests for _validate_pipeline()
@@ -433,6 +438,52 @@ pipeline:
         data = response.json()
         assert data["freshness"]["process"]["status"] == "stale"
 
+    def test_freshness_shared_node_between_steps(self, tmp_path: Path) -> None:
+        """A node that is one step's output and another's input is judged for both."""
+        config = tmp_path / "pipeline.yml"
+        config.write_text("""
+data:
+  input:
+    type: txt
+    path: input.txt
+  middle:
+    type: txt
+    path: middle.txt
+  output:
+    type: txt
+    path: output.txt
+
+pipeline:
+  - name: first
+    task: tasks/first.py
+    inputs:
+      data: $input
+    outputs:
+      -o: $middle
+  - name: second
+    task: tasks/second.py
+    inputs:
+      data: $middle
+    outputs:
+      -o: $output
+""")
+        # input < output < middle: first is fresh, second is stale
+        for name, mtime in [("input.txt", 1000), ("output.txt", 2000), ("middle.txt", 3000)]:
+            path = tmp_path / name
+            path.write_text(name)
+            os.utime(path, (mtime, mtime))
+
+        configure(config_path=config)
+        client = TestClient(app)
+
+        response = client.get("/api/steps/freshness")
+
+        assert response.status_code == 200
+        freshness = response.json()["freshness"]
+        assert freshness["first"]["status"] == "fresh"
+        assert freshness["second"]["status"] == "stale"
+        assert freshness["second"]["reason"] == "Input newer: middle.txt"
+
 
 class TestTrashData:
     """Tests for DELETE /api/data/{name} endpoint."""
@@ -648,6 +699,37 @@ pipeline:
         # Verify it resolved the path relative to pipeline.yml, not cwd
         mock_trash.assert_called_once_with(str(data_file))
 
+    def test_trash_permission_error_returns_403(self, tmp_path: Path) -> None:
+        """Should map a trash permission failure to 403 rather than 500."""
+        from send2trash.exceptions import TrashPermissionError  # type: ignore[import-untyped]
+
+        config = tmp_path / "pipeline.yml"
+        data_file = tmp_path / "data.txt"
+        data_file.write_text("test data")
+
+        config.write_text(f"""
+data:
+  mydata:
+    type: txt
+    path: {data_file}
+pipeline:
+  - name: produce
+    task: tasks/produce.py
+    outputs:
+      out: $mydata
+""")
+        configure(config_path=config)
+        client = TestClient(app)
+
+        with patch(
+            "loom.ui.server.endpoints.send2trash",
+            side_effect=TrashPermissionError(str(data_file)),
+        ):
+            response = client.delete("/api/data/mydata")
+
+        assert response.status_code == 403
+        assert "Failed to trash" in response.json()["detail"]
+
 
 class TestGetDataStatus:
     """Tests for GET /api/data/status endpoint."""
@@ -740,6 +822,42 @@ pipeline:
         step_nodes = [n for n in data["nodes"] if n["type"] == "step"]
         assert step_nodes[0]["data"]["name"] == "process"
 
+    def test_get_then_save_keeps_yaml_11_scalars(self, tmp_path: Path) -> None:
+        """Saving an unedited graph should leave scalars like yes/on untouched."""
+        config = tmp_path / "pipeline.yml"
+        original = """parameters:
+  flag: yes
+  mode: off
+pipeline:
+- name: process
+  task: tasks/process.py
+  args:
+    --x: on
+"""
+        config.write_text(original)
+        configure(config_path=config)
+        client = TestClient(app)
+
+        graph = client.get("/api/config").json()
+        response = client.post("/api/config", json=graph)
+
+        assert response.status_code == 200
+        assert config.read_text() == original
+
+    def test_get_config_reflects_edits_between_requests(self, tmp_path: Path) -> None:
+        """Repeated loads should pick up edits made to the file in between."""
+        config = tmp_path / "pipeline.yml"
+        config.write_text("parameters:\n  threshold: 0.5\npipeline: []\n")
+        configure(config_path=config)
+        client = TestClient(app)
+
+        first = client.get("/api/config").json()
+        config.write_text("parameters:\n  threshold: 0.7\npipeline: []\n")
+        second = client.get("/api/config").json()
+
+        assert first["parameters"] == {"threshold": 0.5}
+        assert second["parameters"] == {"threshold": 0.7}
+
 
 class TestSaveConfig:
     """Tests for POST /api/config endpoint."""
@@ -1309,8 +1427,8 @@ class TestRunStatus:
         """Should return idle status when nothing is running."""
         from loom.ui.server import _execution_state
 
-        _execution_state["status"] = "idle"
-        _execution_state["current_step"] = None
+        _execution_state.status = "idle"
+        _execution_state.current_step = None
 
         client = TestClient(app)
         response = client.get("/api/run/status")
@@ -1324,8 +1442,8 @@ class TestRunStatus:
         """Should return running status with current step."""
         from loom.ui.server import _execution_state
 
-        _execution_state["status"] = "running"
-        _execution_state["current_step"] = "extract_features"
+        _execution_state.status = "running"
+        _execution_state.current_step = "extract_features"
 
         client = TestClient(app)
         response = client.get("/api/run/status")
@@ -1336,6 +1454,58 @@ class TestRunStatus:
         assert data["current_step"] == "extract_features"
 
 
+class TestServeIndex:
+    """Tests for GET / endpoint."""
+
+    def test_serves_built_index_with_etag(self, tmp_path: Path) -> None:
+        """Should serve the built index.html with a strong ETag."""
+        (tmp_path / "index.html").write_text("<html>built</html>")
+
+        with patch("loom.ui.server.endpoints.FRONTEND_DIR", tmp_path):
+            client = TestClient(app)
+            response = client.get("/")
+
+        assert response.status_code == 200
+        assert response.text == "<html>built</html>"
+        assert response.headers["content-type"].startswith("text/html")
+        assert response.headers["etag"].startswith('"')
+
+    def test_returns_304_when_etag_matches(self, tmp_path: Path) -> None:
+        """Should return 304 without a body when the client's copy is current."""
+        (tmp_path / "index.html").write_text("<html>built</html>")
+
+        with patch("loom.ui.server.endpoints.FRONTEND_DIR", tmp_path):
+            client = TestClient(app)
+            etag = client.get("/").headers["etag"]
+            response = client.get("/", headers={"If-None-Match": etag})
+
+        assert response.status_code == 304
+        assert response.content == b""
+
+    def test_picks_up_rebuilt_index(self, tmp_path: Path) -> None:
+        """Should serve the new index.html after the frontend is rebuilt."""
+        index = tmp_path / "index.html"
+        index.write_text("<html>old</html>")
+
+        with patch("loom.ui.server.endpoints.FRONTEND_DIR", tmp_path):
+            client = TestClient(app)
+            old_etag = client.get("/").headers["etag"]
+            index.write_text("<html>rebuilt</html>")
+            response = client.get("/", headers={"If-None-Match": old_etag})
+
+        assert response.status_code == 200
+        assert response.text == "<html>rebuilt</html>"
+
+    def test_serves_setup_page_when_not_built(self, tmp_path: Path) -> None:
+        """Should serve build instructions when index.html is missing."""
+        with patch("loom.ui.server.endpoints.FRONTEND_DIR", tmp_path):
+            client = TestClient(app)
+            response = client.get("/")
+
+        assert response.status_code == 200
+        assert "Setup Required" in response.text
+
+
 class TestCleanPreview:
     """Tests for GET /api/clean/preview endpoint."""
 
@@ -1527,3 +1697,38 @@ pipeline: []
         # Should have skipped results (missing + thumbnails)
         skipped = [r for r in data["results"] if r["action"] == "skipped"]
         assert len(skipped) >= 1
+
+
+class TestTerminalWebSocket:
+    """Tests for the /ws/terminal handler."""
+
+    def test_parallel_run_client_disconnect(self, tmp_path: Path) -> None:
+        """A client leaving mid-run should be handled as a disconnect, not an error."""
+        config = tmp_path / "pipeline.yml"
+        config.write_text("pipeline: []\n")
+        configure(config_path=config)
+
+        never = asyncio.Event()
+
+        async def receive_text() -> str:
+            await never.wait()
+            return ""
+
+        websocket = MagicMock()
+        websocket.accept = AsyncMock()
+        websocket.receive_json = AsyncMock(
+            return_value={"mode": "parallel", "step_names": ["a", "b"]}
+        )
+        websocket.receive_text = receive_text
+        websocket.send_text = AsyncMock()
+        websocket.send_bytes = AsyncMock(side_effect=WebSocketDisconnect())
+        commands = [(name, [sys.executable, "-c", "pass"]) for name in ("a", "b")]
+
+        with (
+            patch("loom.ui.execution.validate_parallel_execution", return_value=(True, "")),
+            patch("loom.ui.execution.build_parallel_commands", return_value=commands),
+        ):
+            asyncio.run(terminal_websocket(websocket))
+
+        sent = [call.args[0] for call in websocket.send_text.call_args_list]
+        assert not any("[ERROR]" in text for text in sent)
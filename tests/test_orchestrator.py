@@ -134,6 +134,41 @@ class TestOrchestratorSequentialExecution:
         # Check results
         assert orch.results == {"step_a": True, "step_b": False, "step_c": False}
 
+    def test_orchestrate_sequential_fail_fast_skips_independent_steps(self) -> None:
+        """Test that fail_fast skips later steps even when they do not depend on the failure."""
+        config = PipelineConfig(
+            variables={},
+            parameters={},
+            steps=[StepConfig(name=name, script=f"{name}.py") for name in ["a", "b", "c"]],
+        )
+        orch = PipelineOrchestrator(config, parallel=False, fail_fast=True)
+        gen = orch.orchestrate()
+
+        assert next(gen).step_name == "a"
+        event = gen.send(StepResult("a", False))
+
+        skipped = []
+        while event.type == EventType.STEP_SKIPPED:
+            assert event.failed_deps == []
+            skipped.append(event.step_name)
+            event = next(gen)
+        assert skipped == ["b", "c"]
+        assert event.type == EventType.PIPELINE_COMPLETE
+
+    def test_orchestrate_steps_runs_given_selection(self, config_linear: PipelineConfig) -> None:
+        """Test orchestrate_steps schedules a preselected list without filtering again."""
+        orch = PipelineOrchestrator(config_linear, parallel=False)
+        steps_to_run = orch.get_steps_to_run(from_step="step_b")
+        gen = orch.orchestrate_steps(steps_to_run)
+
+        event = next(gen)
+        assert event.step_name == "step_b"
+        event = gen.send(StepResult("step_b", True))
+        assert event.step_name == "step_c"
+        event = gen.send(StepResult("step_c", True))
+        assert event.type == EventType.PIPELINE_COMPLETE
+        assert orch.results == {"step_b": True, "step_c": True}
+
 
 class TestOrchestratorParallelExecution:
     """Tests for parallel orchestration."""
@@ -294,6 +329,115 @@ class TestOrchestratorParallelExecution:
 
         assert len(ready_steps) == 2
 
+    def test_orchestrate_parallel_skips_while_sibling_runs(
+        self, config_diamond: PipelineConfig
+    ) -> None:
+        """Test that a failure skips dependents without waiting for unrelated steps."""
+        orch = PipelineOrchestrator(config_diamond, parallel=True, max_workers=4)
+        gen = orch.orchestrate()
+
+        assert next(gen).step_name == "step_a"
+        assert next(gen).type == EventType.WAITING
+        event = gen.send(StepResult("step_a", True))
+        ready_steps = []
+        while event.type == EventType.STEP_READY:
+            ready_steps.append(event.step_name)
+            event = next(gen)
+        assert ready_steps == ["step_b", "step_c"]
+
+        # step_b fails while step_c is still running
+        event = gen.send(StepResult("step_b", False))
+        assert event.type == EventType.STEP_SKIPPED
+        assert event.step_name == "step_d"
+        assert event.failed_deps == ["step_b"]
+        assert next(gen).type == EventType.WAITING
+
+        event = gen.send(StepResult("step_c", True))
+        assert event.type == EventType.PIPELINE_COMPLETE
+        assert orch.results == {
+            "step_a": True,
+            "step_b": False,
+            "step_c": True,
+            "step_d": False,
+        }
+
+    def test_orchestrate_parallel_fail_fast(self, config_independent: PipelineConfig) -> None:
+        """Test that fail_fast skips unstarted steps but waits for running ones."""
+        orch = PipelineOrchestrator(
+            config_independent, parallel=True, max_workers=2, fail_fast=True
+        )
+        gen = orch.orchestrate()
+
+        assert next(gen).step_name == "step_a"
+        assert next(gen).step_name == "step_b"
+        assert next(gen).type == EventType.WAITING
+
+        event = gen.send(StepResult("step_a", False))
+        assert event.type == EventType.STEP_SKIPPED
+        assert event.step_name == "step_c"
+        assert next(gen).type == EventType.WAITING
+
+        event = gen.send(StepResult("step_b", True))
+        assert event.type == EventType.PIPELINE_COMPLETE
+        assert orch.results == {"step_a": False, "step_b": True, "step_c": False}
+
+    def test_orchestrate_parallel_skipped_result(self, config_independent: PipelineConfig) -> None:
+        """Test that a released step reported as skipped is recorded as skipped, not failed."""
+        orch = PipelineOrchestrator(config_independent, parallel=True, max_workers=3)
+        gen = orch.orchestrate()
+
+        assert [next(gen).step_name for _ in range(3)] == ["step_a", "step_b", "step_c"]
+        assert next(gen).type == EventType.WAITING
+
+        event = gen.send(StepResult("step_a", False, skipped=True))
+        assert event.type == EventType.STEP_SKIPPED
+        assert event.step_name == "step_a"
+        assert event.failed_deps == []
+        assert next(gen).type == EventType.WAITING
+
+        # Not a failure: the other steps keep going
+        assert gen.send(StepResult("step_b", True)).type == EventType.WAITING
+        assert gen.send(StepResult("step_c", True)).type == EventType.PIPELINE_COMPLETE
+        assert orch.results == {"step_a": False, "step_b": True, "step_c": True}
+
+    def test_orchestrate_parallel_in_place_step_runs(self) -> None:
+        """Test that a step reading and writing the same data is not blocked on itself."""
+        config = PipelineConfig(
+            variables={"data": "d.csv"},
+            parameters={},
+            steps=[
+                StepConfig(
+                    name="normalize",
+                    script="norm.py",
+                    inputs={"data": "$data"},
+                    outputs={"-o": "$data"},
+                ),
+            ],
+        )
+        orch = PipelineOrchestrator(config, parallel=True)
+        gen = orch.orchestrate()
+
+        event = next(gen)
+        assert event.type == EventType.STEP_READY
+        assert event.step_name == "normalize"
+        assert next(gen).type == EventType.WAITING
+        assert gen.send(StepResult("normalize", True)).type == EventType.PIPELINE_COMPLETE
+
+    def test_orchestrate_parallel_cycle_terminates(self) -> None:
+        """Test that steps stuck in a dependency cycle do not hang the orchestrator."""
+        config = PipelineConfig(
+            variables={"x": "x.csv", "y": "y.csv"},
+            parameters={},
+            steps=[
+                StepConfig(name="a", script="a.py", inputs={"i": "$y"}, outputs={"-o": "$x"}),
+                StepConfig(name="b", script="b.py", inputs={"i": "$x"}, outputs={"-o": "$y"}),
+            ],
+        )
+        orch = PipelineOrchestrator(config, parallel=True)
+        events = list(orch.orchestrate())
+
+        assert [e.type for e in events] == [EventType.PIPELINE_COMPLETE]
+
 
 class TestOrchestratorGetStepsToRun:
     """Tests for PipelineOrchestrator.get_steps_to_run method."""
@@ -1,5 +1,6 @@
 """Tests for loom.runner.cli module."""
 
+import os
 import tempfile
 from pathlib import Path
 from unittest.mock import patch
@@ -103,6 +104,44 @@ class TestCLIStepSelection:
         assert "optional_step" in captured.out
 
 
+class TestCLIIncremental:
+    """Tests for --incremental."""
+
+    def test_cli_incremental_skips_up_to_date_steps(
+        self, tmp_path: Path, capsys: pytest.CaptureFixture[str]
+    ) -> None:
+        """Test --incremental does not launch a step whose output is fresh."""
+        (tmp_path / "input.txt").write_text("in")
+        (tmp_path / "output.txt").write_text("out")
+        os.utime(tmp_path / "input.txt", (1_000_000, 1_000_000))
+        config_file = tmp_path / "pipeline.yml"
+        config_file.write_text(
+            """
+data:
+  input:
+    type: txt
+    path: input.txt
+  output:
+    type: txt
+    path: output.txt
+
+pipeline:
+  - name: process
+    script: missing_script.py
+    inputs:
+      file: $input
+    outputs:
+      -o: $output
+"""
+        )
+
+        with patch("sys.argv", ["loom", str(config_file), "--incremental"]):
+            result = main()
+
+        assert result == 0
+        assert "[UP TO DATE] process" in capsys.readouterr().out
+
+
 class TestCLIOverrides:
     """Tests for CLI override options."""
 
@@ -185,6 +224,19 @@ class TestCLIExtraArgs:
         assert "--level" in captured.out
         assert "2" in captured.out
 
+    def test_cli_extra_args_unbalanced_quote_fails(
+        self, sample_config_file: Path, capsys: pytest.CaptureFixture[str]
+    ) -> None:
+        """Test --extra with an unterminated quote is rejected before running."""
+        with patch(
+            "sys.argv",
+            ["loom", str(sample_config_file), "--step", "process", "--extra", "--title 'oops"],
+        ):
+            result = main()
+
+        assert result == 1
+        assert "Invalid --extra" in capsys.readouterr().err
+
 
 class TestCLIFromStep:
     """Tests for --from option."""
@@ -315,8 +367,9 @@ pipeline:
 
         assert result == 0
         # Should have trashed 2 existing generated files (output.csv and intermediate.txt)
-        # Source data (input.txt) should be protected
-        assert mock_trash.call_count == 2
+        # in one batched call. Source data (input.txt) should be protected
+        mock_trash.assert_called_once()
+        assert len(mock_trash.call_args.args[0]) == 2
 
         captured = capsys.readouterr()
         assert "Moved to trash" in captured.out
@@ -372,8 +425,9 @@ pipeline:
                     result = main()
 
         assert result == 0
-        # Should trash 2 generated files (output.csv and intermediate.txt)
-        assert mock_trash.call_count == 2
+        # Should trash 2 generated files (output.csv and intermediate.txt) in one call
+        mock_trash.assert_called_once()
+        assert len(mock_trash.call_args.args[0]) == 2
 
     def test_clean_cancelled_on_no(
         self, clean_config_file: Path, capsys: pytest.CaptureFixture[str]
@@ -1,5 +1,6 @@
 """Tests for loom.runner.config module."""
 
+import dataclasses
 import tempfile
 from pathlib import Path
 
@@ -48,6 +49,16 @@ class TestStepConfig:
         step = StepConfig.from_dict(data)
         assert step.optional is False
 
+    def test_fields_cannot_be_reassigned(self) -> None:
+        """Test that StepConfig is frozen while its mappings stay editable."""
+        step = StepConfig(name="step", script="script.py")
+
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            step.name = "renamed"  # type: ignore[misc]
+
+        step.args["--flag"] = True
+        assert step.args == {"--flag": True}
+
 
 class TestPipelineConfig:
     """Tests for PipelineConfig dataclass."""
@@ -133,6 +144,49 @@ pipeline:
         assert config.parameters == {}
         assert config.steps == []
 
+    def test_from_yaml_repeated_loads_are_independent(self, config_file: Path) -> None:
+        """Test that mutating one loaded config does not leak into the next load."""
+        first = PipelineConfig.from_yaml(config_file)
+        first.parameters["threshold"] = 0.9
+        first.steps[0].args["--extra"] = True
+
+        second = PipelineConfig.from_yaml(config_file)
+
+        assert second.parameters["threshold"] == 0.5
+        assert "--extra" not in second.steps[0].args
+
+    def test_from_yaml_nested_values_are_independent(self, tmp_path: Path) -> None:
+        """Test that mutating nested parameters and args does not leak into the next load."""
+        config_file = tmp_path / "pipeline.yml"
+        config_file.write_text(
+            "parameters:\n"
+            "  sizes: [1, 2]\n"
+            "  crop: {x: 0}\n"
+            "pipeline:\n"
+            "  - name: step\n"
+            "    script: s.py\n"
+            "    args:\n"
+            "      --sizes: [1, 2]\n"
+        )
+        first = PipelineConfig.from_yaml(config_file)
+        first.parameters["sizes"].append(3)
+        first.parameters["crop"]["x"] = 5
+        first.steps[0].args["--sizes"].append(3)
+
+        second = PipelineConfig.from_yaml(config_file)
+
+        assert second.parameters == {"sizes": [1, 2], "crop": {"x": 0}}
+        assert second.steps[0].args == {"--sizes": [1, 2]}
+
+    def test_from_yaml_picks_up_file_changes(self, config_file: Path) -> None:
+        """Test that reloading after an edit reflects the new content."""
+        PipelineConfig.from_yaml(config_file)
+        config_file.write_text(config_file.read_text().replace("0.5", "0.7"))
+
+        config = PipelineConfig.from_yaml(config_file)
+
+        assert config.parameters["threshold"] == 0.7
+
 
 class TestPipelineConfigResolveValue:
     """Tests for PipelineConfig.resolve_value method."""
@@ -160,6 +214,8 @@ class TestPipelineConfigResolveValue:
         """Test that non-reference strings are returned as-is."""
         assert config.resolve_value("plain_string") == "plain_string"
         assert config.resolve_value("data/file.csv") == "data/file.csv"
+        assert config.resolve_value("") == ""
+        assert config.resolve_value("price_$5") == "price_$5"
 
     def test_resolve_non_string_values(self, config: PipelineConfig) -> None:
         """Test that non-string values are returned as-is."""
@@ -182,6 +238,16 @@ class TestPipelineConfigResolveValue:
         )
         assert config.resolve_value("$name") == "from_variable"
 
+    def test_resolve_sees_direct_mutations(self, config: PipelineConfig) -> None:
+        """Test that edits made directly to variables/parameters are picked up."""
+        config.variables["video"] = "data/other.mp4"
+        config.parameters["threshold"] = 0.9
+        config.parameters["added"] = None
+
+        assert config.resolve_value("$video") == "data/other.mp4"
+        assert config.resolve_value("$threshold") == 0.9
+        assert config.resolve_value("$added") is None
+
 
 class TestPipelineConfigStepLookup:
     """Tests for step lookup methods."""
@@ -210,6 +276,31 @@ class TestPipelineConfigStepLookup:
         with pytest.raises(ValueError, match="Unknown step: nonexistent"):
             config.get_step_by_name("nonexistent")
 
+    def test_get_step_by_name_duplicate_returns_first(self) -> None:
+        """Test that the first step wins when names are duplicated."""
+        first = StepConfig(name="dup", script="a.py")
+        second = StepConfig(name="dup", script="b.py")
+        config = PipelineConfig(variables={}, parameters={}, steps=[first, second])
+
+        assert config.get_step_by_name("dup") is first
+
+    def test_get_step_index(self) -> None:
+        """Test step positions follow definition order, first duplicate winning."""
+        config = PipelineConfig(
+            variables={},
+            parameters={},
+            steps=[
+                StepConfig(name="a", script="a.py"),
+                StepConfig(name="b", script="b.py"),
+                StepConfig(name="a", script="c.py"),
+            ],
+        )
+
+        assert config.get_step_index("a") == 0
+        assert config.get_step_index("b") == 1
+        with pytest.raises(ValueError, match="Unknown step"):
+            config.get_step_index("missing")
+
 
 class TestPipelineConfigDependencies:
     """Tests for dependency tracking."""
@@ -265,6 +356,49 @@ class TestPipelineConfigDependencies:
         # video is not produced by any step, only csv2 is
         assert deps == {"process"}
 
+    def test_get_step_dependencies_is_cached(self, config: PipelineConfig) -> None:
+        """Test repeated queries return the same precomputed immutable set."""
+        process = config.get_step_by_name("process")
+        deps = config.get_step_dependencies(process)
+        assert isinstance(deps, frozenset)
+        assert config.get_step_dependencies(process) is deps
+
+    def test_get_step_dependencies_strips_single_dollar(self) -> None:
+        """Test only one leading '$' is stripped from variable references."""
+        config = PipelineConfig(
+            variables={"a": "a.txt", "$a": "b.txt"},
+            parameters={},
+            steps=[
+                StepConfig(name="make", script="make.py", outputs={"-o": "$a"}),
+                StepConfig(name="use", script="use.py", inputs={"x": "$$a"}),
+            ],
+        )
+        assert config.get_step_dependencies(config.get_step_by_name("use")) == set()
+
+    def test_get_step_dependents(self, config: PipelineConfig) -> None:
+        """Test reverse dependency lookup."""
+        assert config.get_step_dependents("extract") == {"process"}
+        assert config.get_step_dependents("process") == {"visualize"}
+        assert config.get_step_dependents("visualize") == frozenset()
+        assert config.get_step_dependents("missing") == frozenset()
+
+    def test_get_step_dependents_ignores_self(self) -> None:
+        """Test a step that rewrites its own input is not its own dependent."""
+        config = PipelineConfig(
+            variables={"data": "d.csv"},
+            parameters={},
+            steps=[
+                StepConfig(
+                    name="normalize",
+                    script="norm.py",
+                    inputs={"data": "$data"},
+                    outputs={"-o": "$data"},
+                ),
+            ],
+        )
+
+        assert config.get_step_dependents("normalize") == frozenset()
+
 
 class TestPipelineConfigOverrides:
     """Tests for override methods."""
@@ -461,6 +595,22 @@ pipeline: []
 
         assert resolved == Path("/absolute/path/output.csv")
 
+    def test_resolve_path_follows_variable_and_base_dir_changes(self, tmp_path: Path) -> None:
+        """Test that repeated resolution reflects edits to variables and base_dir."""
+        config = PipelineConfig(
+            variables={"output": "data/a.csv"},
+            parameters={},
+            steps=[],
+            base_dir=tmp_path,
+        )
+        assert config.resolve_path("$output") == tmp_path / "data" / "a.csv"
+
+        config.variables["output"] = "data/b.csv"
+        assert config.resolve_path("$output") == tmp_path / "data" / "b.csv"
+
+        config.base_dir = tmp_path / "other"
+        assert config.resolve_path("$output") == tmp_path / "other" / "data" / "b.csv"
+
     def test_resolve_path_with_parameter_reference(self, tmp_path: Path) -> None:
         """Test that resolve_path works with parameter references."""
         config_file = tmp_path / "pipeline.yml"
@@ -507,6 +657,16 @@ pipeline: []
 
         assert resolved == Path("/usr/local/bin/script.py")
 
+    def test_resolve_script_path_repeated_and_after_base_dir_change(self, tmp_path: Path) -> None:
+        """Test that repeated lookups agree and follow a reassigned base_dir."""
+        config = PipelineConfig(variables={}, parameters={}, steps=[], base_dir=tmp_path)
+
+        first = config.resolve_script_path("tasks/a.py")
+        assert config.resolve_script_path("tasks/a.py") == first == tmp_path / "tasks" / "a.py"
+
+        config.base_dir = tmp_path / "moved"
+        assert config.resolve_script_path("tasks/a.py") == tmp_path / "moved" / "tasks" / "a.py"
+
     def test_base_dir_default_is_cwd(self) -> None:
         """Test that base_dir defaults to cwd when not loading from file."""
         config = PipelineConfig(variables={}, parameters={}, steps=[])
@@ -848,6 +1008,14 @@ class TestGroupMethods:
         with pytest.raises(ValueError, match="Unknown group: nonexistent"):
             grouped_config.get_steps_by_group("nonexistent")
 
+    def test_group_queries_return_fresh_lists(self, grouped_config: PipelineConfig) -> None:
+        """Test that mutating a returned list does not change later results."""
+        grouped_config.get_steps_by_group("ingestion").clear()
+        grouped_config.get_group_names().clear()
+
+        assert [s.name for s in grouped_config.get_steps_by_group("ingestion")] == ["gen", "load"]
+        assert grouped_config.get_group_names() == ["ingestion", "analysis"]
+
     def test_get_group_names_returns_unique_in_order(self, grouped_config: PipelineConfig) -> None:
         """Test get_group_names returns unique names in pipeline order."""
         names = grouped_config.get_group_names()
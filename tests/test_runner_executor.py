@@ -1,14 +1,35 @@
 """Tests for loom.runner.executor module."""
 
+import io
+import os
+import shlex
+import subprocess
 import sys
 import tempfile
+import threading
+import time
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
 import pytest
 
 from loom.runner.config import LoopConfig, PipelineConfig, StepConfig
-from loom.runner.executor import PipelineExecutor, parse_key_value_args
+from loom.runner.executor import PipelineExecutor, _list_loop_files, parse_key_value_args
+from loom.runner.url import get_cache_path
+
+
+class _FakePopen:
+    """Stand-in for subprocess.Popen that replays canned merged output."""
+
+    def __init__(self, returncode: int = 0, output: str = "") -> None:
+        self.returncode = returncode
+        self.stdout = io.StringIO(output)
+
+    def __enter__(self) -> "_FakePopen":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.stdout.close()
 
 
 class TestParseKeyValueArgs:
@@ -54,6 +75,23 @@ class TestParseKeyValueArgs:
         result = parse_key_value_args([])
         assert result == {}
 
+    def test_parse_numeric_edge_cases(self) -> None:
+        """Test values at the boundary between numbers and strings."""
+        result = parse_key_value_args(
+            ["a=-3", "b=+.5", "c= 7", "d=1_000", "e=inf", "f=/data/v1.2", "g=", "h=.", "i=٣"]
+        )
+        assert result == {
+            "a": -3,
+            "b": 0.5,
+            "c": 7,
+            "d": 1000,
+            "e": "inf",
+            "f": "/data/v1.2",
+            "g": "",
+            "h": ".",
+            "i": 3,
+        }
+
     def test_parse_invalid_format_raises(self) -> None:
         """Test that invalid format raises ValueError."""
         with pytest.raises(ValueError, match="Invalid format: invalid"):
@@ -167,6 +205,17 @@ class TestPipelineExecutorBuildCommand:
         assert "--count" in cmd
         assert "5" in cmd
 
+    def test_build_command_extra_args_quoting(self, config: PipelineConfig) -> None:
+        """Test quoted extra arguments stay single tokens and token lists pass through."""
+        step = StepConfig(name="test", script="scripts/test.py")
+        executor = PipelineExecutor(config)
+
+        quoted = executor.build_command(step, extra_args="--title 'two words' --n 3")
+        tokens = executor.build_command(step, extra_args=["--title", "two words", "--n", "3"])
+
+        assert quoted[-4:] == ["--title", "two words", "--n", "3"]
+        assert tokens == quoted
+
     def test_build_command_full(self, config: PipelineConfig) -> None:
         """Test building a complete command with all components."""
         step = StepConfig(
@@ -463,6 +512,84 @@ class TestPipelineExecutorEnsureOutputDirs:
 
             assert Path(f"{tmpdir}/subdir/deep").exists()
 
+    def test_ensure_output_dirs_creates_shared_parent_once(self, tmp_path: Path) -> None:
+        """Test that outputs sharing a directory trigger a single mkdir."""
+        config = PipelineConfig(
+            variables={
+                "a": str(tmp_path / "out" / "a.csv"),
+                "b": str(tmp_path / "out" / "b.csv"),
+                "c": str(tmp_path / "other" / "c.csv"),
+            },
+            parameters={},
+            steps=[],
+        )
+        step = StepConfig(
+            name="test",
+            script="test.py",
+            outputs={"--a": "$a", "--b": "$b", "--c": "$c"},
+        )
+        executor = PipelineExecutor(config)
+
+        with patch.object(Path, "mkdir", autospec=True) as mock_mkdir:
+            executor._ensure_output_dirs(step)
+
+        created = sorted(call.args[0] for call in mock_mkdir.call_args_list)
+        assert created == [tmp_path / "other", tmp_path / "out"]
+
+    def test_ensure_output_dirs_skips_existing(self, tmp_path: Path) -> None:
+        """Test that existing output directories cost no mkdir call."""
+        (tmp_path / "out").mkdir()
+        config = PipelineConfig(
+            variables={"a": str(tmp_path / "out" / "a.csv")},
+            parameters={},
+            steps=[],
+        )
+        step = StepConfig(name="test", script="test.py", outputs={"-o": "$a"})
+
+        with patch.object(Path, "mkdir", autospec=True) as mock_mkdir:
+            PipelineExecutor(config)._ensure_output_dirs(step)
+
+        mock_mkdir.assert_not_called()
+
+    @patch("loom.runner.executor.subprocess.run")
+    def test_run_pipeline_creates_output_dirs_up_front(
+        self, mock_run: MagicMock, tmp_path: Path
+    ) -> None:
+        """Test that run_pipeline creates output dirs once, deepest first, before steps run."""
+        mock_run.return_value = MagicMock(returncode=0)
+        config = PipelineConfig(
+            variables={
+                "a": str(tmp_path / "out" / "a.csv"),
+                "b": str(tmp_path / "out" / "nested" / "b.csv"),
+            },
+            parameters={},
+            steps=[
+                StepConfig(name="step1", script="s1.py", outputs={"-o": "$a"}),
+                StepConfig(name="step2", script="s2.py", inputs={"x": "$a"}, outputs={"-o": "$b"}),
+            ],
+            base_dir=tmp_path,
+        )
+        executor = PipelineExecutor(config)
+
+        with patch.object(Path, "mkdir", autospec=True) as mock_mkdir:
+            results = executor.run_pipeline()
+
+        assert results == {"step1": True, "step2": True}
+        created = [call.args[0] for call in mock_mkdir.call_args_list]
+        assert created == [tmp_path / "out" / "nested"]
+
+    def test_run_pipeline_dry_run_creates_no_dirs(self, tmp_path: Path) -> None:
+        """Test that dry runs leave the filesystem untouched."""
+        config = PipelineConfig(
+            variables={"a": str(tmp_path / "out" / "a.csv")},
+            parameters={},
+            steps=[StepConfig(name="step1", script="s1.py", outputs={"-o": "$a"})],
+            base_dir=tmp_path,
+        )
+        PipelineExecutor(config, dry_run=True).run_pipeline()
+
+        assert not (tmp_path / "out").exists()
+
 
 class TestPipelineExecutorRunPipeline:
     """Integration tests for run_pipeline method."""
@@ -518,6 +645,85 @@ class TestPipelineExecutorRunPipeline:
             assert results["step2"] is False
             assert results["step3"] is False
 
+    def test_run_pipeline_piped_output_keeps_order(self, tmp_path: Path) -> None:
+        """Test step headers precede child output when stdout is a pipe."""
+        (tmp_path / "child.py").write_text("print('child output')\n")
+        (tmp_path / "pipeline.yml").write_text(
+            "data: {}\npipeline:\n  - name: only\n    task: child.py\n"
+        )
+        runner = (
+            "from pathlib import Path\n"
+            "from loom.runner.config import PipelineConfig\n"
+            "from loom.runner.executor import PipelineExecutor\n"
+            f"config = PipelineConfig.from_yaml(Path({str(tmp_path / 'pipeline.yml')!r}))\n"
+            "PipelineExecutor(config).run_pipeline()\n"
+        )
+
+        # Block-buffered stdout, as in CI logs
+        env = {k: v for k, v in os.environ.items() if k != "PYTHONUNBUFFERED"}
+        result = subprocess.run(
+            [sys.executable, "-c", runner], capture_output=True, text=True, check=True, env=env
+        )
+
+        lines = result.stdout.splitlines()
+        assert lines.index("[RUNNING] only") < lines.index("child output")
+        assert lines.index("child output") < lines.index("[SUCCESS] only")
+
+    @patch("loom.runner.executor.subprocess.run")
+    def test_run_pipeline_fail_fast(
+        self, mock_run: MagicMock, tmp_path: Path, capsys: pytest.CaptureFixture[str]
+    ) -> None:
+        """Test that fail_fast stops before independent steps after a failure."""
+        mock_run.return_value = MagicMock(returncode=1)
+        config = PipelineConfig(
+            variables={},
+            parameters={},
+            steps=[
+                StepConfig(name="first", script="s1.py"),
+                StepConfig(name="second", script="s2.py"),
+            ],
+            base_dir=tmp_path,
+        )
+
+        results = PipelineExecutor(config, fail_fast=True).run_pipeline()
+
+        assert results == {"first": False, "second": False}
+        assert mock_run.call_count == 1
+        assert "[SKIPPED] second (pipeline stopped after a failure)" in capsys.readouterr().out
+
+    @patch("loom.runner.executor.subprocess.Popen")
+    @patch("loom.runner.orchestrator.os.cpu_count", return_value=8)
+    def test_parallel_fail_fast_default_workers(
+        self, _cpu_count: MagicMock, mock_popen: MagicMock, tmp_path: Path
+    ) -> None:
+        """Test parallel fail_fast with more independent steps than pool threads."""
+
+        def fake_popen(cmd: list[str], **kwargs: object) -> _FakePopen:
+            if cmd[1].endswith("fail.py"):
+                return _FakePopen(1)
+            time.sleep(0.2)  # Still running when the failure is reported
+            return _FakePopen()
+
+        mock_popen.side_effect = fake_popen
+        names = ["fail"] + [f"ok{i}" for i in range(1, 8)]
+        config = PipelineConfig(
+            variables={},
+            parameters={},
+            steps=[StepConfig(name=name, script=f"{name}.py") for name in names],
+            parallel=True,
+            base_dir=tmp_path,
+        )
+
+        results = PipelineExecutor(config, fail_fast=True).run_pipeline()
+
+        # The default pool runs four steps; nothing queued behind them may start
+        assert mock_popen.call_count == 4
+        assert results == {
+            "fail": False,
+            **{f"ok{i}": True for i in range(1, 4)},
+            **{f"ok{i}": False for i in range(4, 8)},
+        }
+
     def test_run_pipeline_empty_returns_empty(self, config: PipelineConfig) -> None:
         """Test that empty step selection returns empty results."""
         executor = PipelineExecutor(config, dry_run=True)
@@ -561,6 +767,137 @@ class TestPipelineExecutorRunPipeline:
             assert results["step1"] is False
 
 
+class TestIncrementalExecution:
+    """Tests for skipping up-to-date steps."""
+
+    @pytest.fixture
+    def config(self, tmp_path: Path) -> PipelineConfig:
+        """Create a two-step chain whose files are all up to date."""
+        for age, name in enumerate(["out.csv", "mid.csv", "in.csv"]):
+            path = tmp_path / name
+            path.write_text(name)
+            os.utime(path, (1_000_000 - age * 100, 1_000_000 - age * 100))
+        return PipelineConfig(
+            variables={
+                "src": str(tmp_path / "in.csv"),
+                "mid": str(tmp_path / "mid.csv"),
+                "out": str(tmp_path / "out.csv"),
+            },
+            parameters={},
+            steps=[
+                StepConfig(
+                    name="first", script="s1.py", inputs={"x": "$src"}, outputs={"-o": "$mid"}
+                ),
+                StepConfig(
+                    name="second", script="s2.py", inputs={"x": "$mid"}, outputs={"-o": "$out"}
+                ),
+            ],
+            base_dir=tmp_path,
+        )
+
+    @staticmethod
+    def _touch_output(cmd: list[str], **kwargs: object) -> MagicMock:
+        """Fake step run that rewrites the step's output."""
+        Path(cmd[cmd.index("-o") + 1]).touch()
+        return MagicMock(returncode=0, stdout="", stderr="")
+
+    @patch("loom.runner.executor.subprocess.run")
+    def test_up_to_date_steps_are_not_run(
+        self,
+        mock_run: MagicMock,
+        config: PipelineConfig,
+        capsys: pytest.CaptureFixture[str],
+    ) -> None:
+        """Test that steps with fresh outputs succeed without launching."""
+        results = PipelineExecutor(config, incremental=True).run_pipeline()
+
+        assert results == {"first": True, "second": True}
+        mock_run.assert_not_called()
+        assert "[UP TO DATE] first" in capsys.readouterr().out
+
+    @patch("loom.runner.executor.subprocess.run")
+    def test_changed_input_reruns_downstream(
+        self, mock_run: MagicMock, config: PipelineConfig
+    ) -> None:
+        """Test that a newer input reruns its step and everything its outputs feed."""
+        mock_run.side_effect = self._touch_output
+        Path(config.variables["src"]).touch()
+
+        results = PipelineExecutor(config, incremental=True).run_pipeline()
+
+        assert results == {"first": True, "second": True}
+        assert mock_run.call_count == 2
+
+    @patch("loom.runner.executor.subprocess.run")
+    def test_missing_output_runs_step(self, mock_run: MagicMock, config: PipelineConfig) -> None:
+        """Test that a missing output makes the step run."""
+        mock_run.side_effect = self._touch_output
+        Path(config.variables["out"]).unlink()
+
+        PipelineExecutor(config, incremental=True).run_pipeline()
+
+        scripts = [call.args[0][1] for call in mock_run.call_args_list]
+        assert len(scripts) == 1
+        assert scripts[0].endswith("s2.py")
+
+    @patch("loom.runner.executor.subprocess.run")
+    def test_missing_input_runs_step(self, mock_run: MagicMock, config: PipelineConfig) -> None:
+        """Test that a missing input runs the step rather than reporting it up to date."""
+        mock_run.return_value = MagicMock(returncode=1, stdout="", stderr="no such file")
+        Path(config.variables["src"]).unlink()
+
+        results = PipelineExecutor(config, incremental=True).run_pipeline()
+
+        assert results["first"] is False
+        assert mock_run.call_args.args[0][1].endswith("s1.py")
+
+    @patch("loom.runner.executor.subprocess.run")
+    def test_url_input_uses_cached_download(
+        self, mock_run: MagicMock, config: PipelineConfig
+    ) -> None:
+        """Test that a URL input is checked through its download in the URL cache."""
+        mock_run.side_effect = self._touch_output
+        url = "https://example.com/in.csv"
+        config.variables["src"] = url
+        cached = get_cache_path(url, config.get_url_cache_dir())
+        cached.parent.mkdir()
+        cached.write_text("in")
+        os.utime(cached, (1_000_000 - 200, 1_000_000 - 200))
+
+        results = PipelineExecutor(config, incremental=True).run_pipeline()
+
+        assert results == {"first": True, "second": True}
+        mock_run.assert_not_called()
+
+        # Not downloaded yet: the step runs and fetches it
+        cached.unlink()
+        with patch("loom.runner.config.ensure_url_downloaded", return_value=cached):
+            PipelineExecutor(config, incremental=True).run_pipeline()
+
+        assert mock_run.call_args_list[0].args[0][1].endswith("s1.py")
+
+    @patch("loom.runner.executor.subprocess.Popen")
+    def test_parallel_up_to_date_steps_are_not_run(
+        self, mock_popen: MagicMock, config: PipelineConfig
+    ) -> None:
+        """Test that parallel mode reports up-to-date steps without a worker."""
+        config.parallel = True
+
+        results = PipelineExecutor(config, incremental=True).run_pipeline()
+
+        assert results == {"first": True, "second": True}
+        mock_popen.assert_not_called()
+
+    @patch("loom.runner.executor.subprocess.run")
+    def test_disabled_by_default(self, mock_run: MagicMock, config: PipelineConfig) -> None:
+        """Test that without incremental mode every step runs."""
+        mock_run.side_effect = self._touch_output
+
+        PipelineExecutor(config).run_pipeline()
+
+        assert mock_run.call_count == 2
+
+
 class TestBuildDependencyGraph:
     """Tests for _build_dependency_graph method."""
 
@@ -648,14 +985,14 @@ class TestParallelExecution:
         assert len(results) == 4
         assert all(results.values())
 
-    @patch("loom.runner.executor.subprocess.run")
+    @patch("loom.runner.executor.subprocess.Popen")
     def test_parallel_execution_respects_dependencies(
-        self, mock_run: MagicMock, config_diamond: PipelineConfig
+        self, mock_popen: MagicMock, config_diamond: PipelineConfig
     ) -> None:
         """Test that parallel execution respects step dependencies."""
         execution_order: list[str] = []
 
-        def mock_subprocess_run(cmd: list[str], **kwargs: dict) -> MagicMock:
+        def fake_popen(cmd: list[str], **kwargs: object) -> _FakePopen:
             # Extract step name from script path
             script = cmd[1]
             if "a.py" in script:
@@ -666,9 +1003,9 @@ class TestParallelExecution:
                 execution_order.append("step_c")
             elif "d.py" in script:
                 execution_order.append("step_d")
-            return MagicMock(returncode=0, stdout="", stderr="")
+            return _FakePopen()
 
-        mock_run.side_effect = mock_subprocess_run
+        mock_popen.side_effect = fake_popen
 
         with tempfile.TemporaryDirectory() as tmpdir:
             config_diamond.variables["a"] = f"{tmpdir}/a.csv"
@@ -690,20 +1027,155 @@ class TestParallelExecution:
             assert execution_order.index("step_b") < execution_order.index("step_d")
             assert execution_order.index("step_c") < execution_order.index("step_d")
 
-    @patch("loom.runner.executor.subprocess.run")
+    @patch("loom.runner.executor.subprocess.Popen")
+    def test_parallel_launches_child_while_unrelated_step_runs(
+        self, mock_popen: MagicMock, tmp_path: Path
+    ) -> None:
+        """Test a step starts as soon as its own parent finishes, not at a level barrier."""
+        child_started = threading.Event()
+
+        def fake_popen(cmd: list[str], **kwargs: object) -> _FakePopen:
+            script = cmd[1]
+            if "slow.py" in script:
+                # Only succeeds if "child" is launched while this step is still running
+                ok = child_started.wait(timeout=5)
+                return _FakePopen(0 if ok else 1)
+            if "child.py" in script:
+                child_started.set()
+            return _FakePopen()
+
+        mock_popen.side_effect = fake_popen
+        config = PipelineConfig(
+            variables={"s": str(tmp_path / "s.csv"), "f": str(tmp_path / "f.csv")},
+            parameters={},
+            steps=[
+                StepConfig(name="slow", script="slow.py", outputs={"-o": "$s"}),
+                StepConfig(name="fast", script="fast.py", outputs={"-o": "$f"}),
+                StepConfig(name="child", script="child.py", inputs={"x": "$f"}),
+            ],
+            parallel=True,
+            max_workers=2,
+        )
+
+        results = PipelineExecutor(config).run_pipeline()
+
+        assert results == {"slow": True, "fast": True, "child": True}
+
+    @patch("loom.runner.executor.subprocess.Popen")
+    def test_parallel_waits_without_polling(
+        self, mock_popen: MagicMock, config_diamond: PipelineConfig, tmp_path: Path
+    ) -> None:
+        """Test the scheduler blocks on completed futures instead of sleeping between polls."""
+        mock_popen.side_effect = lambda cmd, **kwargs: _FakePopen()
+        for name in ["a", "b", "c", "d"]:
+            config_diamond.variables[name] = str(tmp_path / f"{name}.csv")
+
+        with patch("time.sleep", side_effect=AssertionError("scheduler polled")):
+            results = PipelineExecutor(config_diamond).run_pipeline()
+
+        assert all(results.values())
+
+    def test_parallel_interrupt_terminates_running_steps(self, tmp_path: Path) -> None:
+        """Test Ctrl-C during a parallel run stops children that ignore SIGINT."""
+        script = tmp_path / "stubborn.py"
+        script.write_text(
+            "import signal, time\nsignal.signal(signal.SIGINT, signal.SIG_IGN)\ntime.sleep(30)\n"
+        )
+        config = PipelineConfig(
+            variables={},
+            parameters={},
+            steps=[StepConfig(name="stubborn", script=str(script))],
+            parallel=True,
+            max_workers=1,
+            base_dir=tmp_path,
+        )
+        executor = PipelineExecutor(config)
+        started: list[subprocess.Popen[str]] = []
+
+        def interrupted_wait(*args: object, **kwargs: object) -> None:
+            deadline = time.monotonic() + 5
+            while not executor._live_procs and time.monotonic() < deadline:
+                time.sleep(0.01)
+            started.extend(executor._live_procs)
+            raise KeyboardInterrupt
+
+        begin = time.monotonic()
+        with patch("loom.runner.executor.wait", side_effect=interrupted_wait):
+            with pytest.raises(KeyboardInterrupt):
+                executor.run_pipeline()
+
+        assert time.monotonic() - begin < 10
+        assert len(started) == 1
+        assert started[0].returncode is not None
+        assert not executor._live_procs
+
+    def test_parallel_interrupt_starts_no_waiting_items(self, tmp_path: Path) -> None:
+        """Test loop items still waiting for a slot are not started after Ctrl-C."""
+        log = tmp_path / "started.log"
+        script = tmp_path / "stubborn.py"
+        script.write_text(
+            "import signal, time\n"
+            "signal.signal(signal.SIGINT, signal.SIG_IGN)\n"
+            f"open({str(log)!r}, 'a').write('x')\n"
+            "time.sleep(30)\n"
+        )
+        raw = tmp_path / "raw"
+        raw.mkdir()
+        for i in range(4):
+            (raw / f"{i}.txt").write_text("x")
+        config = PipelineConfig(
+            variables={"raw": str(raw), "processed": str(tmp_path / "processed")},
+            parameters={},
+            steps=[
+                StepConfig(name="single", script=str(script)),
+                StepConfig(
+                    name="each",
+                    script=str(script),
+                    inputs={"image": "$loop_item"},
+                    outputs={"--output": "$loop_output"},
+                    loop=LoopConfig(over="$raw", into="$processed"),
+                ),
+            ],
+            parallel=True,
+            max_workers=2,
+            base_dir=tmp_path,
+        )
+        executor = PipelineExecutor(config)
+
+        def interrupted_wait(*args: object, **kwargs: object) -> None:
+            # Both slots are taken, so the remaining items wait for one to free up
+            deadline = time.monotonic() + 5
+            while time.monotonic() < deadline:
+                if log.exists() and len(log.read_text()) == 2:
+                    break
+                time.sleep(0.01)
+            raise KeyboardInterrupt
+
+        begin = time.monotonic()
+        with patch("loom.runner.executor.wait", side_effect=interrupted_wait):
+            with pytest.raises(KeyboardInterrupt):
+                executor.run_pipeline()
+        # Give a thread that slipped past the interrupt time to spawn
+        time.sleep(0.5)
+
+        assert time.monotonic() - begin < 10
+        assert log.read_text() == "xx"
+        assert not executor._live_procs
+
+    @patch("loom.runner.executor.subprocess.Popen")
     def test_parallel_skips_on_failure(
-        self, mock_run: MagicMock, config_diamond: PipelineConfig
+        self, mock_popen: MagicMock, config_diamond: PipelineConfig
     ) -> None:
         """Test that parallel execution skips dependent steps on failure."""
 
-        def mock_subprocess_run(cmd: list[str], **kwargs: dict) -> MagicMock:
+        def fake_popen(cmd: list[str], **kwargs: object) -> _FakePopen:
             script = cmd[1]
             # Make step_a fail
             if "a.py" in script:
-                return MagicMock(returncode=1, stdout="", stderr="error")
-            return MagicMock(returncode=0, stdout="", stderr="")
+                return _FakePopen(1, "error\n")
+            return _FakePopen()
 
-        mock_run.side_effect = mock_subprocess_run
+        mock_popen.side_effect = fake_popen
 
         with tempfile.TemporaryDirectory() as tmpdir:
             config_diamond.variables["a"] = f"{tmpdir}/a.csv"
@@ -769,16 +1241,22 @@ class TestRunStepParallel:
         assert success is True
         assert "[DRY RUN]" in output
 
-    @patch("loom.runner.executor.subprocess.run")
+    def test_run_step_parallel_dry_run_quotes_command(self, config: PipelineConfig) -> None:
+        """Test the logged command quotes arguments so it can be pasted into a shell."""
+        config.variables["input"] = "my data/in.txt"
+        executor = PipelineExecutor(config, dry_run=True)
+        step = config.steps[0]
+
+        _, _, output = executor._run_step_parallel(step)
+
+        assert shlex.split(output.splitlines()[1]) == executor.build_command(step)
+
+    @patch("loom.runner.executor.subprocess.Popen")
     def test_run_step_parallel_captures_output(
-        self, mock_run: MagicMock, config: PipelineConfig
+        self, mock_popen: MagicMock, config: PipelineConfig
     ) -> None:
         """Test that _run_step_parallel captures and prefixes output."""
-        mock_run.return_value = MagicMock(
-            returncode=0,
-            stdout="line1\nline2\n",
-            stderr="warning\n",
-        )
+        mock_popen.return_value = _FakePopen(0, "line1\nline2\nwarning\n")
 
         with tempfile.TemporaryDirectory() as tmpdir:
             config.variables["output"] = f"{tmpdir}/out.txt"
@@ -795,6 +1273,30 @@ class TestRunStepParallel:
             assert "[process] warning" in output
             assert "[SUCCESS] process" in output
 
+    def test_run_step_parallel_keeps_stdout_stderr_order(self, tmp_path: Path) -> None:
+        """Test captured output interleaves stdout and stderr as the child wrote them."""
+        script = tmp_path / "chatty.py"
+        script.write_text(
+            "import sys\n"
+            "print('out1', flush=True)\n"
+            "print('err1', file=sys.stderr, flush=True)\n"
+            "print('out2', flush=True)\n"
+        )
+        config = PipelineConfig(
+            variables={},
+            parameters={},
+            steps=[StepConfig(name="chatty", script=str(script))],
+            parallel=True,
+            base_dir=tmp_path,
+        )
+
+        name, success, output = PipelineExecutor(config)._run_step_parallel(config.steps[0])
+
+        assert success is True
+        lines = output.splitlines()
+        start = lines.index("[chatty] out1")
+        assert lines[start : start + 3] == ["[chatty] out1", "[chatty] err1", "[chatty] out2"]
+
 
 class TestBuildCommandWithLoopBindings:
     """Tests for build_command with loop_bindings parameter."""
@@ -1036,6 +1538,180 @@ class TestLoopStepExecution:
         # The output should be in the processed dir
         assert str(tmp_path / "processed" / "a.txt") in cmd
 
+    @pytest.mark.parametrize("pattern", [None, "*.jpg", "[ab]*", "*", "sub/*.jpg", "**/*.jpg"])
+    def test_list_loop_files_matches_pathlib(self, tmp_path: Path, pattern: str | None) -> None:
+        """Test loop item listing agrees with the Path.glob / iterdir listing."""
+        raw = tmp_path / "raw"
+        (raw / "sub").mkdir(parents=True)
+        for name in ["b.jpg", "a.jpg", "c.png", ".hidden.jpg", "sub/d.jpg"]:
+            (raw / name).write_text(name)
+        (raw / "dir.jpg").mkdir()
+        (raw / "link.jpg").symlink_to(raw / "a.jpg")
+
+        if pattern:
+            expected = sorted(raw.glob(pattern))
+        else:
+            expected = sorted(f for f in raw.iterdir() if f.is_file())
+
+        assert _list_loop_files(raw, pattern) == expected
+
+    def test_loop_command_builder_matches_build_command(self, tmp_path: Path) -> None:
+        """Test the per-item builder resolves shared refs once and matches build_command."""
+        config = PipelineConfig(
+            variables={"model": str(tmp_path / "model.bin")},
+            parameters={"threshold": 0.5, "verbose": True},
+            steps=[
+                StepConfig(
+                    name="process_each",
+                    script="scripts/process.py",
+                    inputs={"image": "$loop_item", "model": "$model"},
+                    outputs={"--output": "$loop_output"},
+                    args={"--threshold": "$threshold", "--verbose": "$verbose"},
+                    loop=LoopConfig(over="$raw", into="$processed"),
+                )
+            ],
+            base_dir=tmp_path,
+        )
+        executor = PipelineExecutor(config)
+        step = config.steps[0]
+        into_path = tmp_path / "processed"
+        items = [tmp_path / "raw" / name for name in ["a.jpg", "b.jpg", "c.jpg"]]
+
+        with patch.object(
+            config, "resolve_path_for_execution", wraps=config.resolve_path_for_execution
+        ) as spy:
+            build = executor._loop_command_builder(step, into_path)
+            commands = [build(item) for item in items]
+
+        assert spy.call_count == 1
+        for item, cmd in zip(items, commands, strict=True):
+            bindings = {"loop_item": str(item), "loop_output": str(into_path / item.name)}
+            assert cmd == executor.build_command(step, loop_bindings=bindings)
+
+    @patch("loom.runner.executor.subprocess.Popen")
+    def test_run_loop_step_captured_parallel_runs_all_items(
+        self, mock_popen: MagicMock, tmp_path: Path
+    ) -> None:
+        """Test captured parallel loop launches every item and keeps output in file order."""
+        raw_dir = tmp_path / "raw"
+        raw_dir.mkdir()
+        for name in ["a.txt", "b.txt", "c.txt"]:
+            (raw_dir / name).write_text(name)
+
+        def fake_popen(cmd: list[str], **kwargs: object) -> _FakePopen:
+            item = Path(cmd[2]).name
+            return _FakePopen(1 if item == "a.txt" else 0, f"{item}\n")
+
+        mock_popen.side_effect = fake_popen
+
+        config = self._make_loop_config(tmp_path, parallel=True)
+        executor = PipelineExecutor(config)
+
+        name, success, output = executor._run_loop_step_captured(config.steps[0])
+
+        assert name == "process_each"
+        assert success is False
+        assert mock_popen.call_count == 3  # Failure of one item does not cancel the rest
+        lines = output.splitlines()
+        assert lines.index("[process_each/a.txt] a.txt") < lines.index("[process_each/c.txt] c.txt")
+        assert "  [FAILED] item a.txt" in lines
+
+    @patch("loom.runner.executor.subprocess.Popen")
+    def test_captured_subprocesses_capped_across_concurrent_loops(
+        self, mock_popen: MagicMock, tmp_path: Path
+    ) -> None:
+        """Test parallel loops run side by side never exceed max_workers subprocesses."""
+        raw_dir = tmp_path / "raw"
+        raw_dir.mkdir()
+        for name in ["a.txt", "b.txt", "c.txt", "d.txt"]:
+            (raw_dir / name).write_text(name)
+
+        lock = threading.Lock()
+        active = 0
+        peak = 0
+
+        def fake_popen(cmd: list[str], **kwargs: object) -> _FakePopen:
+            nonlocal active, peak
+            with lock:
+                active += 1
+                peak = max(peak, active)
+            time.sleep(0.02)
+            with lock:
+                active -= 1
+            return _FakePopen()
+
+        mock_popen.side_effect = fake_popen
+
+        config = self._make_loop_config(tmp_path, parallel=True)
+        config.max_workers = 2
+        executor = PipelineExecutor(config)
+
+        # Two pipeline-level workers each running a loop with its own item pool
+        threads = [
+            threading.Thread(target=executor._run_loop_step_captured, args=(config.steps[0],))
+            for _ in range(2)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert mock_popen.call_count == 8
+        assert peak <= 2
+
+    @patch("loom.runner.executor.subprocess.Popen")
+    def test_parallel_loop_steps_share_item_pool(
+        self, mock_popen: MagicMock, tmp_path: Path
+    ) -> None:
+        """Test consecutive parallel loops reuse one item pool until close()."""
+        raw_dir = tmp_path / "raw"
+        raw_dir.mkdir()
+        for name in ["a.txt", "b.txt", "c.txt"]:
+            (raw_dir / name).write_text(name)
+
+        thread_names: set[str] = set()
+
+        def fake_popen(cmd: list[str], **kwargs: object) -> _FakePopen:
+            thread_names.add(threading.current_thread().name)
+            return _FakePopen()
+
+        mock_popen.side_effect = fake_popen
+
+        config = self._make_loop_config(tmp_path, parallel=True)
+        config.max_workers = 2
+        executor = PipelineExecutor(config)
+        step = config.steps[0]
+
+        first = executor.run_step(step)
+        pool = executor._item_pool
+        second = executor.run_step(step)
+
+        assert first is not None and first.returncode == 0
+        assert second is not None and second.returncode == 0
+
+        assert pool is not None
+        assert executor._item_pool is pool
+        assert len(thread_names) <= 2
+        assert all(name.startswith("loom-item") for name in thread_names)
+
+        executor.close()
+        assert executor._item_pool is None
+
+    @patch("loom.runner.executor.subprocess.Popen")
+    def test_run_pipeline_closes_item_pool(self, mock_popen: MagicMock, tmp_path: Path) -> None:
+        """Test run_pipeline shuts the loop item pool down when it finishes."""
+        raw_dir = tmp_path / "raw"
+        raw_dir.mkdir()
+        (raw_dir / "a.txt").write_text("a")
+        mock_popen.return_value = _FakePopen()
+
+        config = self._make_loop_config(tmp_path, parallel=True)
+        executor = PipelineExecutor(config)
+        executor.run_pipeline()
+
+        assert mock_popen.call_count == 1
+        assert executor._item_pool is None
+
     @patch("loom.runner.executor.subprocess.run")
     def test_run_pipeline_with_loop_step(self, mock_run: MagicMock, tmp_path: Path) -> None:
         """Test that a loop step integrates with run_pipeline."""
@@ -1,6 +1,10 @@
 """Tests for loom.runner.url module."""
 
 import tempfile
+import threading
+import time
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
@@ -123,35 +127,35 @@ class TestGetCachePath:
 class TestCheckUrlExists:
     """Tests for check_url_exists function."""
 
-    @patch("loom.runner.url.requests.head")
+    @patch("requests.head")
     def test_returns_true_for_200(self, mock_head: MagicMock) -> None:
         """Test that 200 status returns True."""
         mock_head.return_value.status_code = 200
 
         assert check_url_exists("https://example.com/file.png") is True
 
-    @patch("loom.runner.url.requests.head")
+    @patch("requests.head")
     def test_returns_true_for_success_codes(self, mock_head: MagicMock) -> None:
         """Test that other success codes return True."""
         for status in [200, 201, 301, 302, 304]:
             mock_head.return_value.status_code = status
             assert check_url_exists("https://example.com/file.png") is True
 
-    @patch("loom.runner.url.requests.head")
+    @patch("requests.head")
     def test_returns_false_for_404(self, mock_head: MagicMock) -> None:
         """Test that 404 status returns False."""
         mock_head.return_value.status_code = 404
 
         assert check_url_exists("https://example.com/missing.png") is False
 
-    @patch("loom.runner.url.requests.head")
+    @patch("requests.head")
     def test_returns_false_for_error_codes(self, mock_head: MagicMock) -> None:
         """Test that error codes return False."""
         for status in [400, 403, 404, 500, 503]:
             mock_head.return_value.status_code = status
             assert check_url_exists("https://example.com/file.png") is False
 
-    @patch("loom.runner.url.requests.head")
+    @patch("requests.head")
     def test_returns_false_on_request_exception(self, mock_head: MagicMock) -> None:
         """Test that request exceptions return False."""
         import requests
@@ -164,7 +168,7 @@ class TestCheckUrlExists:
 class TestDownloadUrl:
     """Tests for download_url function."""
 
-    @patch("loom.runner.url.requests.get")
+    @patch("requests.get")
     def test_downloads_and_caches_file(self, mock_get: MagicMock) -> None:
         """Test that URL is downloaded and cached."""
         mock_get.return_value.iter_content.return_value = [b"test content"]
@@ -181,7 +185,7 @@ class TestDownloadUrl:
             assert result.local_path.exists()
             assert result.from_cache is False
 
-    @patch("loom.runner.url.requests.get")
+    @patch("requests.get")
     def test_returns_cached_file_if_exists(self, mock_get: MagicMock) -> None:
         """Test that cached file is returned without re-downloading."""
         with tempfile.TemporaryDirectory() as tmpdir:
@@ -200,7 +204,7 @@ class TestDownloadUrl:
             assert result.from_cache is True
             mock_get.assert_not_called()
 
-    @patch("loom.runner.url.requests.get")
+    @patch("requests.get")
     def test_force_redownloads_cached_file(self, mock_get: MagicMock) -> None:
         """Test that force=True re-downloads even if cached."""
         mock_get.return_value.iter_content.return_value = [b"new content"]
@@ -221,7 +225,7 @@ class TestDownloadUrl:
             assert result.from_cache is False
             mock_get.assert_called_once()
 
-    @patch("loom.runner.url.requests.get")
+    @patch("requests.get")
     def test_returns_error_on_failure(self, mock_get: MagicMock) -> None:
         """Test that download failure returns error result."""
         import requests
@@ -237,6 +241,62 @@ class TestDownloadUrl:
             assert result.local_path is None
             assert result.error is not None
 
+    @patch("requests.get")
+    def test_interrupted_download_leaves_no_cache_file(self, mock_get: MagicMock) -> None:
+        """Test that a download failing mid-stream is not later treated as cached."""
+        import requests
+
+        def broken_stream(chunk_size: int) -> Iterator[bytes]:
+            yield b"partial"
+            raise requests.ConnectionError("connection reset")
+
+        mock_get.return_value.iter_content.side_effect = broken_stream
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            cache_dir = Path(tmpdir) / URL_CACHE_DIR_NAME
+            url = "https://example.com/file.txt"
+
+            result = download_url(url, cache_dir)
+
+            assert result.success is False
+            assert not get_cache_path(url, cache_dir).exists()
+            assert list(cache_dir.iterdir()) == []
+
+    @patch("requests.get")
+    def test_concurrent_downloads_fetch_once(self, mock_get: MagicMock) -> None:
+        """Test that threads resolving the same URL share one complete download."""
+        started = threading.Event()
+        release = threading.Event()
+
+        def slow_stream(chunk_size: int) -> Iterator[bytes]:
+            started.set()
+            release.wait(timeout=5)
+            yield b"content"
+
+        mock_get.return_value.iter_content.side_effect = slow_stream
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            cache_dir = Path(tmpdir) / URL_CACHE_DIR_NAME
+            url = "https://example.com/file.txt"
+
+            def fetch() -> tuple[UrlCacheResult, bytes]:
+                result = download_url(url, cache_dir)
+                assert result.local_path is not None
+                # Read at once: a caller must never be handed a half-written file
+                return result, result.local_path.read_bytes()
+
+            with ThreadPoolExecutor(max_workers=4) as pool:
+                futures = [pool.submit(fetch) for _ in range(4)]
+                # Hold the first download open while the other threads look for the file
+                started.wait(timeout=5)
+                time.sleep(0.05)
+                release.set()
+                outcomes = [f.result() for f in futures]
+
+            assert mock_get.call_count == 1
+            assert [content for _, content in outcomes] == [b"content"] * 4
+            assert sum(not result.from_cache for result, _ in outcomes) == 1
+
 
 class TestEnsureUrlDownloaded:
     """Tests for ensure_url_downloaded function."""